@@ -3,32 +3,63 @@ from __future__ import annotations
 __version__ = "0.3.8"
 
 import calendar
-import datetime
+import functools
+import io
 import logging
+import mimetypes
 import os
-from typing import List, Optional, Set, Tuple, Union
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Type, Union
 
 import shotgun_api3
+from shotgun_api3 import Fault, ShotgunError
+from shotgun_api3.lib.httplib2 import HttpLib2Error
 from urllib3.exceptions import ProtocolError
 
-from konbinine.enums import SgEntity, SgHumanUserStatus
-from konbinine.exceptions import MissingValueError
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from konbinine.enums import (
+    SgEntity,
+    SgHumanUserStatus,
+    SgNoteStatus,
+    SgProjectStatus,
+)
+from konbinine.exceptions import BulkCreateError, MissingValueError
 from konbinine.fields import (
     ASSET_FIELDS,
+    ASSET_MINIMAL_FIELDS,
     ATTACHMENT_FIELDS,
+    ATTACHMENT_MINIMAL_FIELDS,
     BOOKING_FIELDS,
+    BOOKING_MINIMAL_FIELDS,
     HUMANUSER_FIELDS,
+    HUMANUSER_MINIMAL_FIELDS,
     NOTE_FIELDS,
+    NOTE_MINIMAL_FIELDS,
     PIPELINE_STEP_FIELDS,
+    PIPELINE_STEP_MINIMAL_FIELDS,
     PROJECT_FIELDS,
+    PROJECT_MINIMAL_FIELDS,
     REPLY_FIELDS,
+    REPLY_MINIMAL_FIELDS,
     SHOT_FIELDS,
+    SHOT_MINIMAL_FIELDS,
     TASK_FIELDS,
+    TASK_MINIMAL_FIELDS,
     TIMELOG_FIELDS,
+    TIMELOG_MINIMAL_FIELDS,
     VERSION_FIELDS,
+    VERSION_MINIMAL_FIELDS,
 )
 from konbinine.logs import KonbiniAdapter
 from konbinine.models import (
+    BulkResult,
+    SgBaseModel,
     SgAsset,
     SgAttachment,
     SgBooking,
@@ -48,14 +79,227 @@ from konbinine.types import (
     TNoteThreadCustomEntityFields,
     TNoteThreadReadData,
 )
-from konbinine.utils import SG_DATE_FORMAT
 
 logger = KonbiniAdapter(logging.getLogger(__name__), {})
 logger.setLevel(logging.ERROR)
 
+# Project start and end date is read only (only can be modified using Project Planning app on SG Web)
+PROJECT_UPDATE_EXCLUDED_FIELDS = frozenset(
+    {
+        "start_date",
+        "end_date",
+        "duration",
+        "updated_at",
+        "image",
+    }
+)
+
+# Requires Autodesk Account Portal to update the following fields
+HUMANUSER_UPDATE_EXCLUDED_FIELDS = frozenset(
+    {
+        "email",
+        "firstname",
+        "lastname",
+    }
+)
+
+# Konbini environment variables are read once at import instead of every
+# Konbini instantiation. Call refresh_env() after modifying them.
+KONBINI_ENV_NAMES = (
+    "KONBINI_BASE_URL",
+    "KONBINI_SCRIPT_NAME",
+    "KONBINI_API_KEY",
+    "KONBINI_SCHEMA_TTL",
+)
+_konbini_env: Dict[str, str] = {}
+
+
+def refresh_env():
+    """Refresh Env
+
+    Reload the cached KONBINI_* environment variables.
+
+    """
+    _konbini_env.clear()
+    _konbini_env.update(
+        {
+            name: os.environ.get(name, "")
+            for name in KONBINI_ENV_NAMES
+        }
+    )
+
+
+def get_env(name: str) -> str:
+    """Get Env
+
+    Get the cached KONBINI_* environment variable value. An empty cached value
+    is looked up again in case it is set after import (e.g. loading .env later).
+
+    Parameters
+    ----------
+    name : str
+        The environment variable name
+
+    Returns
+    -------
+    str
+        The value or empty string if not set
+
+    """
+    value = _konbini_env.get(name)
+    if not value:
+        value = os.environ.get(name, "")
+        _konbini_env[name] = value
+
+    return value
+
+
+refresh_env()
+
+
+class KonbiniShotgun(shotgun_api3.Shotgun):
+    """shotgun_api3.Shotgun that decodes responses with orjson when installed
+
+    JSON decoding dominates client CPU time on large find results, and
+    orjson is several times faster than the stdlib json module.
+
+    """
+    # Parts of a multipart upload sent at the same time. shotgun_api3 sends them
+    # one after another, which leaves large movie uploads bound to the throughput
+    # of a single connection. Set to 1 to keep that behaviour.
+    MULTIPART_UPLOAD_WORKERS = 4
+
+    def _json_loads(self, body):
+        if orjson is None:
+            return super()._json_loads(body)
+
+        return orjson.loads(body)
+
+    def _multipart_upload_file_to_storage(self, path: str, upload_info: dict) -> None:
+        file_size = os.path.getsize(path)
+        chunk_size = self._MULTIPART_UPLOAD_CHUNK_SIZE
+        part_count = -(-file_size // chunk_size)
+        if self.MULTIPART_UPLOAD_WORKERS <= 1 or part_count <= 1:
+            return super()._multipart_upload_file_to_storage(path, upload_info)
+
+        filename = os.path.basename(path)
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+        def upload_part(part_number: int) -> str:
+            with open(path, "rb") as fd:
+                fd.seek((part_number - 1) * chunk_size)
+                data = fd.read(chunk_size)
+
+            part_url = self._get_upload_part_link(upload_info, filename, part_number)
+            return self._upload_data_to_storage(
+                io.BytesIO(data),
+                content_type,
+                len(data),
+                part_url,
+            )
+
+        # ETags must be passed in part order, which executor.map keeps
+        with ThreadPoolExecutor(max_workers=min(self.MULTIPART_UPLOAD_WORKERS, part_count)) as executor:
+            etags = list(executor.map(upload_part, range(1, part_count + 1)))
+
+        self._complete_multipart_upload(upload_info, filename, etags)
+
+
+# Shotgun clients are not thread-safe but each one keeps its HTTP connection
+# alive, so share one client per thread for every Konbini using the same args
+_sg_clients = threading.local()
+
+# Marks the threads of Konbini thread pools, see Konbini._map_parallel
+_pool_worker = threading.local()
+
+# Milliseconds between retries of a failed request. A reused keep-alive
+# connection that the server (or proxy) already dropped fails with SSLEOFError
+# and is retried on a fresh connection, so the shotgun_api3 default of 3000 ms
+# is mostly dead time. SHOTGUN_API_RETRY_INTERVAL still takes precedence.
+SG_RPC_ATTEMPT_INTERVAL = 200
+
+
+def get_sg_client(
+    base_url: str,
+    script_name: str,
+    api_key: str,
+) -> shotgun_api3.Shotgun:
+    """Get SG Client
+
+    Get the current thread's shotgun_api3.Shotgun client for the given args,
+    creating it on first use. Reusing the client reuses its keep-alive
+    connection instead of paying another TLS handshake and authentication.
+
+    Parameters
+    ----------
+    base_url : str
+        The SG site URL
+    script_name : str
+        The SG API script name
+    api_key : str
+        The SG API key
+
+    Returns
+    -------
+    shotgun_api3.Shotgun
+
+    """
+    clients: Optional[Dict[Tuple[str, str, str], shotgun_api3.Shotgun]] = getattr(_sg_clients, "clients", None)
+    if clients is None:
+        clients = _sg_clients.clients = {}
+
+    key = (base_url, script_name, api_key)
+    sg = clients.get(key)
+    if sg is None:
+        sg = KonbiniShotgun(*key)
+        if "SHOTGUN_API_RETRY_INTERVAL" not in os.environ:
+            sg.config.rpc_attempt_interval = SG_RPC_ATTEMPT_INTERVAL
+        clients[key] = sg
+
+    return sg
+
 
 class Konbini:
+    """ShotGrid API wrapper
+
+    Konbini.sg hands out one shotgun_api3.Shotgun client per thread (see
+    get_sg_client) as the client is not thread-safe. The concurrent helpers
+    (get_sg_parallel, bulk_*, upload_attachments, etc.) rely on this so every
+    worker thread talks to SG over its own keep-alive connection. A client
+    assigned explicitly to Konbini.sg is used as is instead, so the concurrent
+    helpers run sequentially on the calling thread.
+
+    The concurrent helpers share one thread pool of up to MAX_WORKERS threads,
+    started on first use. Use close() or the context manager to shut it down.
+
+    """
     NO_SSL_VALIDATION = False
+    PAGE_SIZE = 500  # SG caps records per page at 500
+    BATCH_SIZE = 500  # Requests per sg.batch call
+    MAX_WORKERS = 16  # Threads of the shared pool, caps concurrent SG requests
+    SCHEMA_CACHE_TTL = 600  # Seconds. Override with KONBINI_SCHEMA_TTL env
+
+    # SG default values that are validated locally without querying the schema.
+    # Values not listed here (e.g. studio custom statuses) still query the schema.
+    KNOWN_VALID_VALUES: Dict[Tuple[str, str], FrozenSet[str]] = {
+        (SgEntity.PROJECT, "sg_status"): frozenset(
+            {
+                SgProjectStatus.ACTIVE,
+            }
+        ),
+        (SgEntity.HUMANUSER, "sg_status_list"): frozenset(
+            {
+                SgHumanUserStatus.ACTIVE,
+                SgHumanUserStatus.DISABLED,
+            }
+        ),
+        (SgEntity.NOTE, "sg_status_list"): frozenset(
+            {
+                SgNoteStatus.OPEN,
+                SgNoteStatus.CLOSED,
+            }
+        ),
+    }
 
     def __init__(
         self,
@@ -65,13 +309,13 @@ class Konbini:
     ):
         # Higher precedence for params value
         if not base_url:
-            base_url = os.environ.get("KONBINI_BASE_URL", default="")
+            base_url = get_env("KONBINI_BASE_URL")
 
         if not script_name:
-            script_name = os.environ.get("KONBINI_SCRIPT_NAME", default="")
+            script_name = get_env("KONBINI_SCRIPT_NAME")
 
         if not api_key:
-            api_key = os.environ.get("KONBINI_API_KEY", default="")
+            api_key = get_env("KONBINI_API_KEY")
 
         # Verify values exists from either params or env
         if not base_url:
@@ -86,25 +330,49 @@ class Konbini:
         # Override shotgun NO_SSL_VALIDATION value
         shotgun_api3.shotgun.NO_SSL_VALIDATION = self.NO_SSL_VALIDATION
 
-        self.connect(
-            base_url,
-            script_name,
-            api_key,
-        )
+        # Schema rarely changes so cache it to spare create/update validations
+        # a schema_field_read round-trip. Keyed by (entity, field_name).
+        self.schema_cache_ttl = float(get_env("KONBINI_SCHEMA_TTL") or self.SCHEMA_CACHE_TTL)
+        self._schema_cache: Dict[Tuple[str, Optional[str]], Tuple[float, List[str]]] = {}
+
+        # Starting threads for every concurrent call adds up so the helpers
+        # share one pool, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        # Connecting to SG authenticates over the network so defer it until
+        # the first SG call. Use connect() to connect eagerly instead.
+        self._sg_args = (base_url, script_name, api_key)
+        self._sg: Optional[shotgun_api3.Shotgun] = None
+
+    @property
+    def sg(self) -> shotgun_api3.Shotgun:
+        # An explicitly assigned client takes precedence over the per-thread clients
+        if self._sg is not None:
+            return self._sg
+
+        return self.connect()
+
+    @sg.setter
+    def sg(self, value: shotgun_api3.Shotgun):
+        self._sg = value
 
     def connect(
         self,
-        base_url: str,
-        script_name: str,
-        api_key: str,
-    ):
-        try:
-            self.sg = shotgun_api3.Shotgun(
-                base_url,
-                script_name,
-                api_key,
+        base_url: Optional[str] = None,
+        script_name: Optional[str] = None,
+        api_key: Optional[str] = None,
+    ) -> shotgun_api3.Shotgun:
+        if base_url or script_name or api_key:
+            self._sg_args = (
+                base_url or self._sg_args[0],
+                script_name or self._sg_args[1],
+                api_key or self._sg_args[2],
             )
-        except (ProtocolError, Exception) as e:
+
+        try:
+            return get_sg_client(*self._sg_args)
+        except (ProtocolError, HttpLib2Error, shotgun_api3.AuthenticationFault, OSError) as e:
             # TODO: Handle this gracefully? The SG outage back in 2023-01-04 (UTC) breaks BADLY and
             #  resulted in this weird exception handling. Refer to https://health.autodesk.com/incidents/d3tbvtvrmq1y
             #  Forgot to include this link https://status.shotgridsoftware.com/
@@ -115,6 +383,229 @@ class Konbini:
                 "https://status.shotgridsoftware.com/"
             )
 
+        return self.sg
+
+    def as_async(self, max_workers: Optional[int] = None):
+        """As Async
+
+        Wrap this Konbini with AsyncKonbini so its methods can be awaited
+        concurrently (e.g. with asyncio.gather) from an event loop.
+
+        Parameters
+        ----------
+        max_workers : int
+            Maximum number of worker threads. Default None uses the
+            ThreadPoolExecutor default. Always 1 if a client was assigned
+            explicitly to Konbini.sg as that client is not thread-safe
+
+        Returns
+        -------
+        AsyncKonbini
+
+        """
+        from konbinine.aio import AsyncKonbini
+
+        return AsyncKonbini(max_workers=max_workers, konbini=self)
+
+    def _get_cached_schema(self, key: Tuple[str, Optional[str]]) -> Optional[List[str]]:
+        cached = self._schema_cache.get(key)
+        if cached is None:
+            return None
+
+        cached_at, value = cached
+        if time.monotonic() - cached_at > self.schema_cache_ttl:
+            self._schema_cache.pop(key, None)
+            return None
+
+        return list(value)
+
+    def _set_cached_schema(self, key: Tuple[str, Optional[str]], value: List[str]):
+        self._schema_cache[key] = (time.monotonic(), list(value))
+
+    def __enter__(self) -> Konbini:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Shut down the shared thread pool
+
+        The pool is started again if a concurrent helper is called afterward.
+
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.MAX_WORKERS,
+                    thread_name_prefix="konbini-sg",
+                    initializer=self._init_pool_worker,
+                )
+
+            return self._executor
+
+    @staticmethod
+    def _init_pool_worker():
+        _pool_worker.active = True
+
+    def _map_parallel(self, fn: Callable[[Any], Any], items: list, max_workers: int) -> list:
+        # Run fn over items on the shared pool with at most max_workers in flight.
+        # Same as executor.map, the results are in order and the first error is
+        # raised after every item is done. Calls made from a pool thread (e.g. a
+        # get_sg_parallel call that chunks its own finds) run inline instead as
+        # waiting on the pool from inside it can use up every thread. Same with an
+        # explicitly assigned client as every worker would share that one client,
+        # which is not thread-safe.
+        if (
+            len(items) <= 1
+            or max_workers == 1
+            or self._sg is not None
+            or getattr(_pool_worker, "active", False)
+        ):
+            return [fn(item) for item in items]
+
+        executor = self._get_executor()
+        futures = []
+        in_flight = set()
+        for item in items:
+            if len(in_flight) >= max_workers:
+                _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+
+            future = executor.submit(fn, item)
+            futures.append(future)
+            in_flight.add(future)
+
+        wait(in_flight)
+
+        return [future.result() for future in futures]
+
+    def _iter_find(
+            self,
+            model: Type[SgBaseModel],
+            entity: str,
+            filters: List[list],
+            fields: List[str],
+            order: Optional[List[dict]] = None,
+            page_size: int = PAGE_SIZE,
+    ) -> Iterator[SgBaseModel]:
+        # SG silently caps the page size, which would stop the paging early
+        page_size = min(page_size, self.PAGE_SIZE)
+
+        # Sort by id last so the pages stay stable between requests
+        order = list(order or []) + [{"field_name": "id", "direction": "asc"}]
+
+        def fetch_page(page: int) -> List[dict]:
+            return self.sg.find(entity, filters, fields, order=order, limit=page_size, page=page)
+
+        # An explicitly assigned client is shared with the caller's thread and is
+        # not thread-safe so fetch the pages inline instead of in the background.
+        # Same on a pool thread as waiting on the pool from inside it can use up
+        # every thread (see _map_parallel).
+        if self._sg is not None or getattr(_pool_worker, "active", False):
+            page = 1
+            while True:
+                rows = fetch_page(page)
+                yield from map(model.from_dict, rows)
+                if len(rows) < page_size:
+                    return
+
+                page += 1
+
+        # Fetch the next page on the shared pool while the current page is
+        # consumed. The pool threads keep their SG clients between calls.
+        executor = self._get_executor()
+        page = 1
+        next_page = executor.submit(fetch_page, page)
+        while next_page is not None:
+            rows = next_page.result()
+            next_page = None
+            if len(rows) == page_size:
+                page += 1
+                next_page = executor.submit(fetch_page, page)
+
+            yield from map(model.from_dict, rows)
+
+    @staticmethod
+    def _as_id_list(entity_id: Optional[Union[int, Set[int], List[int]]]) -> Optional[List[int]]:
+        if entity_id is None:
+            return None
+
+        if isinstance(entity_id, int):
+            return [entity_id]
+
+        # Lists are passed through as is instead of copied
+        return entity_id if type(entity_id) is list else list(entity_id)
+
+    @classmethod
+    def _get_id_filters(cls, entity_id: Optional[Union[int, Set[int], List[int]]]) -> List[list]:
+        if not entity_id:
+            return []
+
+        return [["id", "in", cls._as_id_list(entity_id)]]
+
+    @staticmethod
+    def _get_project_filters(project_id: int) -> List[list]:
+        return [["project", "is", [{"id": project_id, "type": SgEntity.PROJECT}]]]
+
+    def _find_by_ids(
+            self,
+            entity: str,
+            entity_id: List[int],
+            fields: List[str],
+            chunk_size: int = PAGE_SIZE,
+            max_workers: int = 4,
+    ) -> List[dict]:
+        # Split long "id in" filters to keep each request small and run the
+        # finds concurrently. self.sg is resolved in each worker thread.
+        if len(entity_id) <= chunk_size:
+            return self.sg.find(entity, [["id", "in", entity_id]], fields)
+
+        def find_chunk(chunk: List[int]) -> List[dict]:
+            return self.sg.find(entity, [["id", "in", chunk]], fields)
+
+        results = self.get_sg_parallel(
+            [
+                functools.partial(find_chunk, chunk)
+                for chunk in self._batched(entity_id, chunk_size)
+            ],
+            max_workers=max_workers,
+        )
+        return [row for rows in results for row in rows]
+
+    @staticmethod
+    def _batched(items: list, size: int) -> Iterator[list]:
+        # itertools.batched is only available from Python 3.12
+        for i in range(0, len(items), size):
+            yield items[i:i + size]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _get_user_refs(humanuser_ids: FrozenSet[int]) -> Tuple[dict, ...]:
+        # Cached as polling the same users (e.g. timesheet dashboards) would
+        # otherwise rebuild identical refs. Treat the dicts as read-only.
+        entity_type = SgEntity.HUMANUSER
+        return tuple({"id": _, "type": entity_type} for _ in humanuser_ids)
+
+    @classmethod
+    def _as_user_refs(cls, humanuser_id: List[int]) -> List[dict]:
+        return list(cls._get_user_refs(frozenset(humanuser_id)))
+
+    def clear_schema_cache(self):
+        """Clear Schema Cache
+
+        Discard the cached schema fields and valid values. Useful after
+        modifying the schema on SG Web without waiting for the cache TTL.
+
+        """
+        self._schema_cache.clear()
+
     def get_sg_entity_schema_fields(self, entity: str) -> List[str]:
         """Get SG Entity Schema Fields
 
@@ -129,8 +620,24 @@ class Konbini:
             The list of fields belonging to the entity type
 
         """
+        cache_key = (entity, None)
+        cached_fields = self._get_cached_schema(cache_key)
+        if cached_fields is not None:
+            return cached_fields
+
         fields = self.sg.schema_field_read(entity_type=entity)
-        return list(fields.keys())
+        fields = list(fields.keys())
+        self._set_cached_schema(cache_key, fields)
+        return fields
+
+    def _validate_value(self, entity: str, field_name: str, value: str):
+        # Values known to be valid skip the schema lookup entirely
+        if value in self.KNOWN_VALID_VALUES.get((entity, field_name), ()):
+            return
+
+        valid_values = self.get_valid_values(entity, field_name)
+        if value not in valid_values:
+            raise ValueError(f"Invalid {value} value! Valid values: {valid_values}")
 
     def get_valid_values(self, entity: str, field_name: str) -> List[str]:
         """Get Valid Values
@@ -148,18 +655,25 @@ class Konbini:
             The list of valid values
 
         """
+        cache_key = (entity, field_name)
+        cached_values = self._get_cached_schema(cache_key)
+        if cached_values is not None:
+            return cached_values
+
         response_data = self.sg.schema_field_read(entity, field_name)
         try:
             valid_values: List[str] = response_data[field_name]["properties"]["valid_values"]["value"]
         except (KeyError, Exception) as e:
             raise e
 
+        self._set_cached_schema(cache_key, valid_values)
         return valid_values
 
     def get_sg_projects(
             self,
             project_id: Union[int, Set[int], List[int]] = None,
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
     ) -> List[SgProject]:
         """Get SG Projects
 
@@ -169,6 +683,8 @@ class Konbini:
             ShotGrid Project ID. Default None which retrieve all Projects
         custom_fields: list[str]
             List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
 
         Returns
         -------
@@ -178,12 +694,7 @@ class Konbini:
         """
         filters = []
         if project_id:
-            if isinstance(project_id, int):
-                project_id = [project_id]
-
-            if isinstance(project_id, set):
-                project_id = list(project_id)
-
+            project_id = self._as_id_list(project_id)
             filters = [
                 [
                     "id",
@@ -192,12 +703,12 @@ class Konbini:
                 ]
             ]
 
-        fields = PROJECT_FIELDS
+        fields = PROJECT_MINIMAL_FIELDS if minimal else PROJECT_FIELDS
         if custom_fields:
             fields = custom_fields
 
         projects_: List[dict] = self.sg.find(SgEntity.PROJECT, filters, fields)
-        projects = [SgProject.from_dict(_) for _ in projects_]
+        projects = list(map(SgProject.from_dict, projects_))
         return projects
 
     def create_sg_project(self, data: SgProject, **kwargs) -> int:
@@ -218,16 +729,14 @@ class Konbini:
 
         """
         if not isinstance(data, SgProject):
-            raise Exception("Data must be instance of SgProject!")
+            raise TypeError("Data must be instance of SgProject!")
 
         create_data = {
             "name": data.name,
             "sg_description": data.sg_description,
         }
         if data.sg_status:
-            valid_values = self.get_valid_values(SgEntity.PROJECT, "sg_status")
-            if data.sg_status not in valid_values:
-                raise Exception(f"Invalid {data.sg_status} value! Valid values: {valid_values}")
+            self._validate_value(SgEntity.PROJECT, "sg_status", data.sg_status)
 
             create_data["sg_status"] = data.sg_status
 
@@ -247,7 +756,7 @@ class Konbini:
             )
             created_id = response_data["id"]
             logger.info(f"SgProject {created_id} successfully created")
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError, KeyError) as e:
+        except (Fault, ShotgunError, KeyError) as e:
             logger.error(
                 {
                     "msg": "Fail to create SG Project",
@@ -255,8 +764,6 @@ class Konbini:
                     "data": data,
                 }
             )
-        except Exception as e:
-            logger.error(f"Unhandled exception when creating SgProject {data.name}: {e}")
 
         return created_id
 
@@ -275,24 +782,15 @@ class Konbini:
 
         """
         if not isinstance(data, SgProject):
-            raise Exception("Data must be instance of SgProject!")
+            raise TypeError("Data must be instance of SgProject!")
 
         if not data.id:
-            raise Exception("No SgProject ID found!")
+            raise ValueError("No SgProject ID found!")
 
         if data.sg_status:
-            valid_values = self.get_valid_values(SgEntity.PROJECT, "sg_status")
-            if data.sg_status not in valid_values:
-                raise Exception(f"Invalid {data.sg_status} value! Valid values: {valid_values}")
-
-        data_ = data.to_dict()
+            self._validate_value(SgEntity.PROJECT, "sg_status", data.sg_status)
 
-        # Project start and end date is read only (only can be modified using Project Planning app on SG Web)
-        data_.pop("start_date", None)
-        data_.pop("end_date", None)
-        data_.pop("duration", None)
-        data_.pop("updated_at", None)
-        data_.pop("image", None)
+        data_ = data.to_dict(exclude=PROJECT_UPDATE_EXCLUDED_FIELDS)
 
         # Make sure it is str, bytes or os.PathLike object
         is_image_upload = data_.pop("image_upload", None)
@@ -310,10 +808,8 @@ class Konbini:
             )
             is_updated = True
             logger.info(f"Update SgProject {data.id} successful")
-        except shotgun_api3.ShotgunError as e:
+        except ShotgunError as e:
             logger.error(f"Error updating SgProject {data.id}: {e}")
-        except Exception as e:
-            logger.error(f"Unhandled exception when updating SgProject {data.id}: {e}")
 
         return is_updated
 
@@ -321,6 +817,7 @@ class Konbini:
             self,
             step_id: Union[int, Set[int], List[int]] = None,
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
     ) -> List[SgPipelineStep]:
         """Get SG Pipeline Steps (aka Step entity)
 
@@ -330,6 +827,8 @@ class Konbini:
             ShotGrid Pipeline Step ID. Default None which retrieve all Pipeline Steps
         custom_fields: list[str]
             List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
 
         Returns
         -------
@@ -339,11 +838,7 @@ class Konbini:
         """
         filters = []
         if step_id:
-            if isinstance(step_id, int):
-                step_id = [step_id]
-
-            if isinstance(step_id, set):
-                step_id = list(step_id)
+            step_id = self._as_id_list(step_id)
 
             filters = [
                 [
@@ -353,12 +848,12 @@ class Konbini:
                 ]
             ]
 
-        fields = PIPELINE_STEP_FIELDS
+        fields = PIPELINE_STEP_MINIMAL_FIELDS if minimal else PIPELINE_STEP_FIELDS
         if custom_fields:
             fields = custom_fields
 
         steps_: List[dict] = self.sg.find(SgEntity.STEP, filters, fields)
-        steps = [SgPipelineStep.from_dict(_) for _ in steps_]
+        steps = list(map(SgPipelineStep.from_dict, steps_))
         return steps
 
     def create_sg_pipeline_step(self, data: SgPipelineStep, **kwargs) -> int:
@@ -379,7 +874,7 @@ class Konbini:
 
         """
         if not isinstance(data, SgPipelineStep):
-            raise Exception("Data must be instance of SgPipelineStep!")
+            raise TypeError("Data must be instance of SgPipelineStep!")
 
         create_data = {
             "code": data.code,
@@ -400,7 +895,7 @@ class Konbini:
             )
             created_id = response_data["id"]
             logger.info(f"SgPipelineStep {created_id} successfully created")
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError, KeyError) as e:
+        except (Fault, ShotgunError, KeyError) as e:
             logger.error(
                 {
                     "msg": "Fail to create SG Pipeline Step",
@@ -408,8 +903,6 @@ class Konbini:
                     "data": data,
                 }
             )
-        except Exception as e:
-            logger.error(f"Unhandled exception when creating SgPipelineStep {data.code}: {e}")
 
         return created_id
 
@@ -428,10 +921,10 @@ class Konbini:
 
         """
         if not isinstance(data, SgPipelineStep):
-            raise Exception("Data must be instance of SgPipelineStep!")
+            raise TypeError("Data must be instance of SgPipelineStep!")
 
         if not data.id:
-            raise Exception("No SgPipelineStep ID found!")
+            raise ValueError("No SgPipelineStep ID found!")
 
         data_ = data.to_dict()
         data_.update(**kwargs)
@@ -445,10 +938,8 @@ class Konbini:
             )
             is_updated = True
             logger.info(f"Update SgPipelineStep {data.id} successful")
-        except shotgun_api3.ShotgunError as e:
+        except ShotgunError as e:
             logger.error(f"Error updating SgPipelineStep {data.id}: {e}")
-        except Exception as e:
-            logger.error(f"Unhandled exception when updating SgPipelineStep {data.id}: {e}")
 
         return is_updated
 
@@ -456,6 +947,7 @@ class Konbini:
             self,
             humanuser_id: Optional[Union[int, Set[int], List[int]]] = None,
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
     ) -> List[SgHumanUser]:
         """Get SG HumanUsers
 
@@ -465,6 +957,8 @@ class Konbini:
             ShotGrid HumanUser ID. Default None which retrieve all valid HumanUser
         custom_fields : list[str]
             List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
 
         Returns
         -------
@@ -473,12 +967,7 @@ class Konbini:
 
         """
         filters = []
-        if isinstance(humanuser_id, int):
-            humanuser_id = [humanuser_id]
-
-        if isinstance(humanuser_id, set):
-            humanuser_id = list(humanuser_id)
-
+        humanuser_id = self._as_id_list(humanuser_id)
         if humanuser_id:
             filters = [
                 [
@@ -488,17 +977,18 @@ class Konbini:
                 ]
             ]
 
-        fields = HUMANUSER_FIELDS
+        fields = HUMANUSER_MINIMAL_FIELDS if minimal else HUMANUSER_FIELDS
         if custom_fields:
             fields = custom_fields
 
         users_: List[dict] = self.sg.find(SgEntity.HUMANUSER, filters, fields)
-        users = [SgHumanUser.from_dict(_) for _ in users_]
+        users = list(map(SgHumanUser.from_dict, users_))
         return users
 
     def get_active_sg_humanusers(
             self,
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
     ) -> List[SgHumanUser]:
         """Get Active SG HumanUsers
 
@@ -506,6 +996,8 @@ class Konbini:
         ----------
         custom_fields : list[str]
             List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
 
         Returns
         -------
@@ -521,19 +1013,12 @@ class Konbini:
             ]
         ]
 
-        fields = HUMANUSER_FIELDS
+        fields = HUMANUSER_MINIMAL_FIELDS if minimal else HUMANUSER_FIELDS
         if custom_fields:
             fields = custom_fields
 
         _users: List[dict] = self.sg.find(SgEntity.HUMANUSER, filters, fields)
-        if not _users:
-            return []
-
-        users = []
-        for user in _users:
-            sg_humanuser = SgHumanUser.from_dict(user)
-            users.append(sg_humanuser)
-
+        users = list(map(SgHumanUser.from_dict, _users))
         return users
 
     def create_sg_humanuser(self, data: SgHumanUser, **kwargs) -> int:
@@ -560,9 +1045,7 @@ class Konbini:
 
         """
         if data.sg_status_list:
-            valid_values = self.get_valid_values(SgEntity.HUMANUSER, "sg_status_list")
-            if data.sg_status_list not in valid_values:
-                raise Exception(f"Invalid {data.sg_status_list} value! Valid values: {valid_values}")
+            self._validate_value(SgEntity.HUMANUSER, "sg_status_list", data.sg_status_list)
 
         create_data = data.to_dict()
         create_data.update(**kwargs)
@@ -572,7 +1055,7 @@ class Konbini:
             response_data = self.sg.create(SgEntity.HUMANUSER, create_data)
             created_id = response_data["id"]
             logger.info(f"SgHumanUser {response_data['id']} successfully created")
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError, KeyError) as e:
+        except (Fault, ShotgunError, KeyError) as e:
             logger.error(
                 {
                     "msg": "Fail to create SG HumanUser",
@@ -580,8 +1063,6 @@ class Konbini:
                     "data": data,
                 }
             )
-        except Exception as e:
-            logger.error(f"Unhandled exception when creating SgHumanUser {data.name}: {e}")
 
         return created_id
 
@@ -600,26 +1081,22 @@ class Konbini:
 
         """
         if not isinstance(data, SgHumanUser):
-            raise Exception("Data must be instance of SgHumanUser!")
+            raise TypeError("Data must be instance of SgHumanUser!")
 
         if not data.id:
-            raise Exception("No SgHumanUser ID found!")
+            raise ValueError("No SgHumanUser ID found!")
 
         if data.sg_status_list:
-            valid_values = self.get_valid_values(SgEntity.HUMANUSER, "sg_status_list")
-            if data.sg_status_list not in valid_values:
-                raise Exception(f"Invalid {data.sg_status_list} value! Valid values: {valid_values}")
+            self._validate_value(SgEntity.HUMANUSER, "sg_status_list", data.sg_status_list)
 
         is_updated = True
-        data_ = data.to_dict()
-
-        # Requires Autodesk Account Portal to update the following fields
-        data_.pop("email", None)
-        data_.pop("firstname", None)
-        data_.pop("lastname", None)
-
+        data_ = data.to_dict(exclude=HUMANUSER_UPDATE_EXCLUDED_FIELDS)
         data_.update(**kwargs)
 
+        # Nothing to update so skip the round-trip
+        if not data_:
+            return True
+
         try:
             self.sg.update(
                 entity_type=SgEntity.HUMANUSER,
@@ -627,7 +1104,7 @@ class Konbini:
                 data=data_,
             )
             logger.info(f"Update HumanUser {data.id} successful")
-        except shotgun_api3.ShotgunError as e:
+        except ShotgunError as e:
             logger.error(f"Error updating HumanUser {data.id}: {e}")
             is_updated = False
 
@@ -640,6 +1117,7 @@ class Konbini:
         self,
         booking_id: Union[int, Set[int], List[int]] = None,
         custom_fields: Optional[List[str]] = None,
+        minimal: bool = False,
     ) -> List[SgBooking]:
         """Get SG Bookings
 
@@ -649,6 +1127,8 @@ class Konbini:
             ShotGrid Booking ID. Default None which retrieve all Bookings
         custom_fields: list[str]
             List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
 
         Returns
         -------
@@ -658,12 +1138,7 @@ class Konbini:
         """
         filters = []
         if booking_id:
-            if isinstance(booking_id, int):
-                booking_id = [booking_id]
-
-            if isinstance(booking_id, set):
-                booking_id = list(booking_id)
-
+            booking_id = self._as_id_list(booking_id)
             filters = [
                 [
                     "id",
@@ -672,18 +1147,19 @@ class Konbini:
                 ]
             ]
 
-        fields = BOOKING_FIELDS
+        fields = BOOKING_MINIMAL_FIELDS if minimal else BOOKING_FIELDS
         if custom_fields:
             fields = custom_fields
 
         bookings_: List[dict] = self.sg.find(SgEntity.BOOKING, filters, fields)
-        bookings = [SgBooking.from_dict(_) for _ in bookings_]
+        bookings = list(map(SgBooking.from_dict, bookings_))
         return bookings
 
     def get_sg_bookings_by_user(
             self,
             humanuser_id: Union[int, Set[int], List[int]],
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
     ) -> List[SgBooking]:
         """Get SG Bookings
 
@@ -693,6 +1169,8 @@ class Konbini:
             ShotGrid HumanUser ID
         custom_fields: list[str]
             List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
 
         Returns
         -------
@@ -700,16 +1178,7 @@ class Konbini:
             List of SgBooking or empty list if no results from ShotGrid
 
         """
-        if isinstance(humanuser_id, int):
-            humanuser_id = [humanuser_id]
-
-        if isinstance(humanuser_id, set):
-            humanuser_id = list(humanuser_id)
-
-        users = [
-            {"id": _, "type": SgEntity.HUMANUSER}
-            for _ in humanuser_id
-        ]
+        users = self._as_user_refs(self._as_id_list(humanuser_id))
         filters = [
             [
                 "user",
@@ -718,71 +1187,51 @@ class Konbini:
             ]
         ]
 
-        fields = BOOKING_FIELDS
+        fields = BOOKING_MINIMAL_FIELDS if minimal else BOOKING_FIELDS
         if custom_fields:
             fields = custom_fields
 
         bookings_: List[dict] = self.sg.find(SgEntity.BOOKING, filters, fields)
-        bookings = [SgBooking.from_dict(_) for _ in bookings_]
+        bookings = list(map(SgBooking.from_dict, bookings_))
         return bookings
 
-    def get_sg_bookings_by_year(
+    def get_sg_bookings_by_date_range(
             self,
-            year: int,
-            humanuser_id: Optional[int | Set[int] | List[int]] = None,
+            start_date: str,
+            end_date: str,
+            humanuser_id: Optional[Union[int, Set[int], List[int]]] = None,
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
     ) -> List[SgBooking]:
-        """Get SG Bookings by Year
-        
+        """Get SG Bookings by Date Range
+
+        Retrieve every Booking starting within the date range in a single query
+        instead of querying month by month or year by year.
+
         Parameters
         ----------
-        year : int
-            Calendar year
+        start_date : str
+            Inclusive start of the range in YYYY-MM-DD format
+        end_date : str
+            Inclusive end of the range in YYYY-MM-DD format
         humanuser_id : int | Set[int] | List[int]
             ShotGrid HumanUser ID. Default None which retrieve all
             bookings for every valid HumanUser
         custom_fields: list[str]
             List of custom fields
-                  
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
+
         Returns
         -------
         list[SgBooking]
-            List of SgBooking or empty list if no results from ShotGrid
-        
-        """
-        current_dt = datetime.datetime.now()
-        current_year = current_dt.year
-        sg_year_offset = 0
-        if not year == current_year:
-            sg_year_offset = year - current_year
-
-        filters = [
-            [
-                "start_date",
-                "in_calendar_year",
-                sg_year_offset,
-            ]
-        ]
-        if humanuser_id:
-            if isinstance(humanuser_id, int):
-                humanuser_id = [humanuser_id]
-
-            if isinstance(humanuser_id, set):
-                humanuser_id = list(humanuser_id)
+            List of SgBooking sorted by start date or empty list if no results
+            from ShotGrid
 
-            users = [
-                {"id": _, "type": SgEntity.HUMANUSER}
-                for _ in humanuser_id
-            ]
-            filters.append(
-                [
-                    "user",
-                    "in",
-                    users,
-                ]
-            )
+        """
+        filters = self._get_bookings_date_range_filters(start_date, end_date, humanuser_id)
 
-        fields = BOOKING_FIELDS
+        fields = BOOKING_MINIMAL_FIELDS if minimal else BOOKING_FIELDS
         if custom_fields:
             fields = custom_fields
 
@@ -794,82 +1243,104 @@ class Konbini:
         ]
 
         bookings_: List[dict] = self.sg.find(SgEntity.BOOKING, filters, fields, order=order)
-        bookings = [SgBooking.from_dict(_) for _ in bookings_]
+        bookings = list(map(SgBooking.from_dict, bookings_))
         return bookings
 
-    def get_sg_bookings_by_month_year(
+    def iter_sg_bookings_by_date_range(
             self,
-            month: int,
-            year: int,
+            start_date: str,
+            end_date: str,
             humanuser_id: Optional[Union[int, Set[int], List[int]]] = None,
             custom_fields: Optional[List[str]] = None,
-    ) -> List[SgBooking]:
-        """Get SG Bookings by Month Year
+            minimal: bool = False,
+            page_size: int = PAGE_SIZE,
+    ) -> Iterator[SgBooking]:
+        """Iterate SG Bookings by Date Range
+
+        Same as get_sg_bookings_by_date_range but retrieve the Bookings page by
+        page, yielding each SgBooking as its page arrives. Memory stays bounded
+        to about one page while the next page is fetched in the background.
 
         Parameters
         ----------
-        month : int
-            Calendar month
-        year : int
-            Calendar year
+        start_date : str
+            Inclusive start of the range in YYYY-MM-DD format
+        end_date : str
+            Inclusive end of the range in YYYY-MM-DD format
         humanuser_id : int | Set[int] | List[int]
             ShotGrid HumanUser ID. Default None which retrieve all
             bookings for every valid HumanUser
         custom_fields: list[str]
             List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
+        page_size : int
+            Number of Bookings per request. Default and maximum 500
 
-        Returns
-        -------
-        list[SgBooking]
-            List of SgBooking or empty list if no results from ShotGrid
+        Yields
+        ------
+        SgBooking
+            SgBooking sorted by start date
 
         """
-        current_dt = datetime.datetime.now()
-        current_month = current_dt.month
-        current_year = current_dt.year
+        filters = self._get_bookings_date_range_filters(start_date, end_date, humanuser_id)
 
-        sg_month_offset = 0
-        if not month == current_month:
-            sg_month_offset = month - current_month
+        fields = BOOKING_MINIMAL_FIELDS if minimal else BOOKING_FIELDS
+        if custom_fields:
+            fields = custom_fields
 
-        filters = [
-            [
-                "start_date",
-                "in_calendar_month",
-                sg_month_offset,
-            ],
+        order = [
+            {
+                "field_name": "start_date",
+                "direction": "asc",
+            }
         ]
 
-        sg_year_offset = 0
-        if not year == current_year:
-            sg_year_offset = year - current_year
+        yield from self._iter_find(SgBooking, SgEntity.BOOKING, filters, fields, order, page_size)
 
-        if sg_year_offset:
-            last_day_of_month = calendar.monthrange(year, month)[1]
-            filters = [
-                [
-                    "start_date",
-                    "is",
-                    f"{year}-{month:02}-01",
-                ],
-                [
-                    "end_date",
-                    "is",
-                    f"{year}-{month:02}-{last_day_of_month}",
-                ],
-            ]
+    def iter_sg_bookings_by_year(
+            self,
+            year: int,
+            humanuser_id: Optional[Union[int, Set[int], List[int]]] = None,
+            custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
+            page_size: int = PAGE_SIZE,
+    ) -> Iterator[SgBooking]:
+        """Iterate SG Bookings by Year
 
-        if humanuser_id:
-            if isinstance(humanuser_id, int):
-                humanuser_id = [humanuser_id]
+        Paged counterpart of get_sg_bookings_by_year. Refer to
+        iter_sg_bookings_by_date_range for the parameters.
+
+        Yields
+        ------
+        SgBooking
+            SgBooking sorted by start date
 
-            if isinstance(humanuser_id, set):
-                humanuser_id = list(humanuser_id)
+        """
+        yield from self.iter_sg_bookings_by_date_range(
+            f"{year}-01-01",
+            f"{year}-12-31",
+            humanuser_id=humanuser_id,
+            custom_fields=custom_fields,
+            minimal=minimal,
+            page_size=page_size,
+        )
 
-            users = [
-                {"id": _, "type": SgEntity.HUMANUSER}
-                for _ in humanuser_id
+    def _get_bookings_date_range_filters(
+            self,
+            start_date: str,
+            end_date: str,
+            humanuser_id: Optional[Union[int, Set[int], List[int]]] = None,
+    ) -> List[list]:
+        filters = [
+            [
+                "start_date",
+                "between",
+                [start_date, end_date],
             ]
+        ]
+        if humanuser_id:
+            users = self._as_user_refs(self._as_id_list(humanuser_id))
             filters.append(
                 [
                     "user",
@@ -878,31 +1349,81 @@ class Konbini:
                 ]
             )
 
-        fields = BOOKING_FIELDS
-        if custom_fields:
-            fields = custom_fields
+        return filters
 
-        order = [
-            {
-                "field_name": "start_date",
-                "direction": "asc",
-            }
-        ]
+    def get_sg_bookings_by_year(
+            self,
+            year: int,
+            humanuser_id: Optional[int | Set[int] | List[int]] = None,
+            custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
+    ) -> List[SgBooking]:
+        """Get SG Bookings by Year
+        
+        Parameters
+        ----------
+        year : int
+            Calendar year
+        humanuser_id : int | Set[int] | List[int]
+            ShotGrid HumanUser ID. Default None which retrieve all
+            bookings for every valid HumanUser
+        custom_fields: list[str]
+            List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
+                  
+        Returns
+        -------
+        list[SgBooking]
+            List of SgBooking or empty list if no results from ShotGrid
+        
+        """
+        return self.get_sg_bookings_by_date_range(
+            f"{year}-01-01",
+            f"{year}-12-31",
+            humanuser_id=humanuser_id,
+            custom_fields=custom_fields,
+            minimal=minimal,
+        )
 
-        bookings_: List[dict] = self.sg.find(SgEntity.BOOKING, filters, fields, order=order)
-        if not bookings_:
-            return []
+    def get_sg_bookings_by_month_year(
+            self,
+            month: int,
+            year: int,
+            humanuser_id: Optional[Union[int, Set[int], List[int]]] = None,
+            custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
+    ) -> List[SgBooking]:
+        """Get SG Bookings by Month Year
 
-        bookings = []
-        for booking in bookings_:
-            sg_booking = SgBooking.from_dict(booking)
-            booking_dt = datetime.datetime.strptime(sg_booking.start_date, SG_DATE_FORMAT)
-            if booking_dt.month != month or booking_dt.year != year:
-                continue
+        Parameters
+        ----------
+        month : int
+            Calendar month
+        year : int
+            Calendar year
+        humanuser_id : int | Set[int] | List[int]
+            ShotGrid HumanUser ID. Default None which retrieve all
+            bookings for every valid HumanUser
+        custom_fields: list[str]
+            List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
 
-            bookings.append(sg_booking)
+        Returns
+        -------
+        list[SgBooking]
+            List of SgBooking or empty list if no results from ShotGrid
 
-        return bookings
+        """
+        last_day_of_month = calendar.monthrange(year, month)[1]
+        return self.get_sg_bookings_by_date_range(
+            f"{year}-{month:02}-01",
+            f"{year}-{month:02}-{last_day_of_month}",
+            humanuser_id=humanuser_id,
+            custom_fields=custom_fields,
+            minimal=minimal,
+        )
 
     def create_sg_booking(self, data: SgBooking, **kwargs) -> int:
         """Create SG Booking
@@ -936,11 +1457,12 @@ class Konbini:
             }
             
         """
-        if data.sg_status_list:
-            valid_values = self.get_valid_values(SgEntity.BOOKING, "sg_status_list")
-            if data.sg_status_list not in valid_values:
-                raise Exception(f"Invalid {data.sg_status_list} value! Valid values: {valid_values}")
+        self._validate_booking_status(data)
+
+        return self._create_sg_booking(data, **kwargs)
 
+    def _create_sg_booking(self, data: SgBooking, **kwargs) -> int:
+        # Unchecked create_sg_booking for callers that validated data upfront
         create_data = data.to_dict()
         create_data.update(
             {
@@ -957,7 +1479,7 @@ class Konbini:
             response_data = self.sg.create(SgEntity.BOOKING, create_data)
             created_id = response_data["id"]
             logger.info(f"SgBooking {created_id} successfully created")
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError, KeyError) as e:
+        except (Fault, ShotgunError, KeyError) as e:
             logger.error(
                 {
                     "msg": "Fail to create SG Booking",
@@ -965,8 +1487,6 @@ class Konbini:
                     "data": data,
                 }
             )
-        except Exception as e:
-            logger.error(f"Unhandled exception when creating SgBooking: {e}")
 
         return created_id
 
@@ -985,20 +1505,25 @@ class Konbini:
 
         """
         if not isinstance(data, SgBooking):
-            raise Exception("Data must be instance of SgBooking!")
+            raise TypeError("Data must be instance of SgBooking!")
 
         if not data.id:
-            raise Exception("No SgBooking ID found!")
+            raise ValueError("No SgBooking ID found!")
 
-        if data.sg_status_list:
-            valid_values = self.get_valid_values(SgEntity.BOOKING, "sg_status_list")
-            if data.sg_status_list not in valid_values:
-                raise Exception(f"Invalid {data.sg_status_list} value! Valid values: {valid_values}")
+        self._validate_booking_status(data)
 
+        return self._update_sg_booking(data, **kwargs)
+
+    def _update_sg_booking(self, data: SgBooking, **kwargs) -> bool:
+        # Unchecked update_sg_booking for callers that validated data upfront
         is_updated = True
         data_ = data.to_dict()
         data_.update(**kwargs)
 
+        # Nothing to update so skip the round-trip
+        if not data_:
+            return True
+
         try:
             self.sg.update(
                 entity_type=SgEntity.BOOKING,
@@ -1006,7 +1531,7 @@ class Konbini:
                 data=data_,
             )
             logger.info(f"Update Booking {data.id} successful")
-        except shotgun_api3.ShotgunError as e:
+        except ShotgunError as e:
             logger.error(f"Error updating Booking {data.id}: {e}")
             is_updated = False
 
@@ -1031,7 +1556,7 @@ class Konbini:
         is_deleted = False
         try:
             is_deleted = self.sg.delete(SgEntity.BOOKING, booking_id)
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError) as e:
+        except (Fault, ShotgunError) as e:
             logger.error(
                 {
                     "msg": f"Fail to delete SG Booking ID {booking_id}",
@@ -1041,6 +1566,74 @@ class Konbini:
 
         return is_deleted
 
+    def bulk_create_sg_bookings(self, data: List[SgBooking], max_workers: int = 8) -> List[int]:
+        """Bulk Create SG Bookings
+
+        Create SG Booking entities concurrently on a thread pool. Every Booking
+        is validated upfront, then created with the same error handling as
+        create_sg_booking.
+
+        Parameters
+        ----------
+        data : list[SgBooking]
+            List of SgBooking data for create
+        max_workers : int
+            Maximum number of concurrent create requests. Default 8
+
+        Returns
+        -------
+        list[int]
+            The created Booking IDs in the same order as data. Failed creates
+            are 0
+
+        """
+        if not data:
+            return []
+
+        # Validate every status upfront so an invalid one fails before any create
+        for booking in data:
+            self._validate_booking_status(booking)
+
+        return self._map_parallel(self._create_sg_booking, data, max_workers)
+
+    def bulk_update_sg_bookings(self, data: List[SgBooking], max_workers: int = 8) -> List[bool]:
+        """Bulk Update SG Bookings
+
+        Update SG Booking entities concurrently on a thread pool. Every Booking
+        is validated upfront, then updated with the same error handling as
+        update_sg_booking.
+
+        Parameters
+        ----------
+        data : list[SgBooking]
+            List of SgBooking data for update
+        max_workers : int
+            Maximum number of concurrent update requests. Default 8
+
+        Returns
+        -------
+        list[bool]
+            True for each Booking updated successfully in the same order as data
+
+        """
+        if not data:
+            return []
+
+        for booking in data:
+            if not isinstance(booking, SgBooking):
+                raise TypeError("Data must be instance of SgBooking!")
+
+            if not booking.id:
+                raise ValueError("No SgBooking ID found!")
+
+            self._validate_booking_status(booking)
+
+        return self._map_parallel(self._update_sg_booking, data, max_workers)
+
+    def _validate_booking_status(self, data: SgBooking):
+        if data.sg_status_list:
+            self._validate_value(SgEntity.BOOKING, "sg_status_list", data.sg_status_list)
+
     def create_sg_note(self, data: SgNote, **kwargs) -> int:
         """Create SG Note
 
@@ -1090,23 +1683,21 @@ class Konbini:
 
         """
         if data.project is None:
-            raise Exception(f"Project is required!")
+            raise ValueError(f"Project is required!")
 
         if data.user is None:
-            raise Exception(
+            raise ValueError(
                 f"User is required! If no explicit user is provided, the note's author "
                 f"will default to the API Key when viewed on SG Web."
             )
 
         if not data.addressings_to:
-            raise Exception(
+            raise ValueError(
                 f"Include at least one HumanUser for addressings_to field!"
             )
 
         if data.sg_status_list:
-            valid_values = self.get_valid_values(SgEntity.NOTE, "sg_status_list")
-            if data.sg_status_list not in valid_values:
-                raise Exception(f"Invalid {data.sg_status_list} value! Valid values: {valid_values}")
+            self._validate_value(SgEntity.NOTE, "sg_status_list", data.sg_status_list)
 
         create_data = data.to_dict()
         create_data.update(
@@ -1124,7 +1715,7 @@ class Konbini:
             response_data = self.sg.create(SgEntity.NOTE, create_data)
             created_id = response_data["id"]
             logger.info(f"SgNote {created_id} successfully created")
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError, KeyError) as e:
+        except (Fault, ShotgunError, KeyError) as e:
             logger.error(
                 {
                     "msg": "Fail to create SG Note",
@@ -1132,8 +1723,6 @@ class Konbini:
                     "data": data,
                 }
             )
-        except Exception as e:
-            logger.error(f"Unhandled exception when creating SgNote: {e}")
 
         return created_id
 
@@ -1141,6 +1730,7 @@ class Konbini:
             self,
             note_id: Union[int, Set[int], List[int]] = None,
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
     ) -> List[SgNote]:
         """Get SG Notes
 
@@ -1150,6 +1740,8 @@ class Konbini:
             ShotGrid Note ID. Default None which retrieves all notes
         custom_fields: list[str]
             Optional. List of valid fields for SG Note.
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
 
         Returns
         -------
@@ -1159,12 +1751,7 @@ class Konbini:
         """
         filters = []
         if note_id:
-            if isinstance(note_id, int):
-                note_id = [note_id]
-
-            if isinstance(note_id, set):
-                note_id = list(note_id)
-
+            note_id = self._as_id_list(note_id)
             filters = [
                 [
                     "id",
@@ -1173,12 +1760,12 @@ class Konbini:
                 ]
             ]
 
-        fields = NOTE_FIELDS
+        fields = NOTE_MINIMAL_FIELDS if minimal else NOTE_FIELDS
         if custom_fields:
             fields = custom_fields
 
         notes_: List[dict] = self.sg.find(SgEntity.NOTE, filters, fields)
-        notes = [SgNote.from_dict(t) for t in notes_]
+        notes = list(map(SgNote.from_dict, notes_))
         return notes
 
     def get_sg_notes_by_entity(self, entity_id: int, entity_type: str) -> List[SgNote]:
@@ -1210,7 +1797,7 @@ class Konbini:
         fields = NOTE_FIELDS
 
         notes_ = self.sg.find(SgEntity.NOTE, filters, fields)
-        notes = [SgNote.from_dict(n) for n in notes_]
+        notes = list(map(SgNote.from_dict, notes_))
         return notes
 
     def get_sg_notes_by_project(self, project_id: int) -> List[SgNote]:
@@ -1227,24 +1814,35 @@ class Konbini:
             List of SgNote or empty list if no results from ShotGrid
         
         """
-        filters = [
-            [
-                "project",
-                "is",
-                [
-                    {
-                        "id": project_id,
-                        "type": SgEntity.PROJECT,
-                    }
-                ]
-            ]
-        ]
+        filters = self._get_project_filters(project_id)
         fields = NOTE_FIELDS
 
         notes_ = self.sg.find(SgEntity.NOTE, filters, fields)
-        notes = [SgNote.from_dict(n) for n in notes_]
+        notes = list(map(SgNote.from_dict, notes_))
         return notes
 
+    def iter_sg_notes_by_project(self, project_id: int, page_size: int = PAGE_SIZE) -> Iterator[SgNote]:
+        """Iterate SG Notes by Project
+
+        Same as get_sg_notes_by_project but retrieve the Notes page by page,
+        yielding each SgNote as its page arrives.
+
+        Parameters
+        ----------
+        project_id : int
+            ShotGrid Project ID.
+        page_size : int
+            Number of Notes per request. Default and maximum 500
+
+        Yields
+        ------
+        SgNote
+
+        """
+        filters = self._get_project_filters(project_id)
+
+        yield from self._iter_find(SgNote, SgEntity.NOTE, filters, NOTE_FIELDS, page_size=page_size)
+
     def get_sg_note_thread_contents(
             self,
             note_id: int,
@@ -1282,12 +1880,9 @@ class Konbini:
                 note_id=note_id,
                 entity_fields=custom_entity_fields,
             )
-        except shotgun_api3.ShotgunError as e:
+        except ShotgunError as e:
             logger.warning(f"Error retrieving thread contents for Note {note_id}: {e}")
             raise e
-        except Exception as e:
-            logger.error(f"Unhandled exception when retrieving thread contents for Note {note_id}: {e}")
-            raise e
 
         # TODO: Rework this logic in the future but for now minimal happy flow
         # Sanitize the response data first before processing the sanitized data
@@ -1359,15 +1954,13 @@ class Konbini:
 
         """
         if not isinstance(data, SgNote):
-            raise Exception("Data must be instance of SgNote!")
+            raise TypeError("Data must be instance of SgNote!")
 
         if not data.id:
-            raise Exception("No SgNote ID found!")
+            raise ValueError("No SgNote ID found!")
 
         if data.sg_status_list:
-            valid_values = self.get_valid_values(SgEntity.NOTE, "sg_status_list")
-            if data.sg_status_list not in valid_values:
-                raise Exception(f"Invalid {data.sg_status_list} value! Valid values: {valid_values}")
+            self._validate_value(SgEntity.NOTE, "sg_status_list", data.sg_status_list)
 
         is_successful_update = True
         data_ = data.to_dict()
@@ -1377,15 +1970,12 @@ class Konbini:
             self.sg.update(
                 entity_type=SgEntity.NOTE,
                 entity_id=data.id,
-                data=data.to_dict(),
+                data=data_,
             )
             logger.info(f"Update Note {data.id} successful")
-        except shotgun_api3.ShotgunError as e:
+        except ShotgunError as e:
             logger.warning(f"Error updating Note {data.id}: {e}")
             is_successful_update = False
-        except Exception as e:
-            logger.error(f"Unhandled exception when updating Note {data.id}: {e}")
-            is_successful_update = False
 
         return is_successful_update
 
@@ -1393,6 +1983,7 @@ class Konbini:
             self,
             reply_id: Union[int, Set[int], List[int]] = None,
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
     ) -> List[SgReply]:
         """Get SG Replies
 
@@ -1402,6 +1993,8 @@ class Konbini:
             ShotGrid Reply ID. Default None which retrieves all replies
         custom_fields: list[str]
             Optional. List of valid fields for SG Reply.
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
 
         Returns
         -------
@@ -1411,11 +2004,7 @@ class Konbini:
         """
         filters = []
         if reply_id:
-            if isinstance(reply_id, int):
-                reply_id = [reply_id]
-
-            if isinstance(reply_id, set):
-                reply_id = list(reply_id)
+            reply_id = self._as_id_list(reply_id)
 
             filters = [
                 [
@@ -1425,12 +2014,12 @@ class Konbini:
                 ]
             ]
 
-        fields = REPLY_FIELDS
+        fields = REPLY_MINIMAL_FIELDS if minimal else REPLY_FIELDS
         if custom_fields:
             fields = custom_fields
 
         notes_: List[dict] = self.sg.find(SgEntity.REPLY, filters, fields)
-        notes = [SgReply.from_dict(t) for t in notes_]
+        notes = list(map(SgReply.from_dict, notes_))
         return notes
 
     def create_sg_reply(self, data: SgReply, **kwargs) -> int:
@@ -1466,10 +2055,10 @@ class Konbini:
 
         """
         if not data.content:
-            raise Exception("Content cannot be left blank!")
+            raise ValueError("Content cannot be left blank!")
 
         if not data.user or not data.user.id:
-            raise Exception("Requires explicit user!")
+            raise ValueError("Requires explicit user!")
 
         data_ = data.to_dict()
         data_.update(**kwargs)
@@ -1479,7 +2068,7 @@ class Konbini:
             response_data = self.sg.create(SgEntity.REPLY, data_)
             created_id = response_data["id"]
             logger.info(f"SgReply {created_id} successfully created")
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError) as e:
+        except (Fault, ShotgunError) as e:
             logger.error(
                 {
                     "msg": "Fail to create SG Reply",
@@ -1487,8 +2076,6 @@ class Konbini:
                     "data": data,
                 }
             )
-        except Exception as e:
-            logger.error(f"Unhandled exception when creating SgReply {data.code}: {e}")
 
         return created_id
 
@@ -1507,16 +2094,16 @@ class Konbini:
 
         """
         if not isinstance(data, SgReply):
-            raise Exception("Data must be instance of SgReply!")
+            raise TypeError("Data must be instance of SgReply!")
 
         if not data.id:
-            raise Exception("No SgReply ID found!")
+            raise ValueError("No SgReply ID found!")
 
         if not data.content:
-            raise Exception("Content cannot be left blank!")
+            raise ValueError("Content cannot be left blank!")
 
         if not data.user or not data.user.id:
-            raise Exception("Requires explicit user!")
+            raise ValueError("Requires explicit user!")
 
         is_successful_update = True
         data_ = data.to_dict()
@@ -1526,15 +2113,12 @@ class Konbini:
             self.sg.update(
                 entity_type=SgEntity.REPLY,
                 entity_id=data.id,
-                data=data.to_dict(),
+                data=data_,
             )
             logger.info(f"Update Reply {data.id} successful")
-        except shotgun_api3.ShotgunError as e:
+        except ShotgunError as e:
             logger.warning(f"Error updating Note {data.id}: {e}")
             is_successful_update = False
-        except Exception as e:
-            logger.error(f"Unhandled exception when updating Reply {data.id}: {e}")
-            is_successful_update = False
 
         return is_successful_update
 
@@ -1542,6 +2126,7 @@ class Konbini:
             self,
             asset_id: Union[int, Set[int], List[int]] = None,
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
     ) -> List[SgAsset]:
         """Get SG Assets
 
@@ -1551,6 +2136,8 @@ class Konbini:
             ShotGrid Asset ID. Default None which retrieve all Assets
         custom_fields: list[str]
             List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
 
         Returns
         -------
@@ -1560,11 +2147,7 @@ class Konbini:
         """
         filters = []
         if asset_id:
-            if isinstance(asset_id, int):
-                asset_id = [asset_id]
-
-            if isinstance(asset_id, set):
-                asset_id = list(asset_id)
+            asset_id = self._as_id_list(asset_id)
 
             filters = [
                 [
@@ -1574,15 +2157,52 @@ class Konbini:
                 ]
             ]
 
-        fields = ASSET_FIELDS
+        fields = ASSET_MINIMAL_FIELDS if minimal else ASSET_FIELDS
         if custom_fields:
             fields = custom_fields
 
         # If content is 'Idle', the entity value will be None
         assets_: List[dict] = self.sg.find(SgEntity.ASSET, filters, fields)
-        assets = [SgAsset.from_dict(t) for t in assets_]
+        assets = list(map(SgAsset.from_dict, assets_))
         return assets
 
+    def iter_sg_assets(
+            self,
+            asset_id: Optional[Union[int, Set[int], List[int]]] = None,
+            custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
+            page_size: int = PAGE_SIZE,
+    ) -> Iterator[SgAsset]:
+        """Iterate SG Assets
+
+        Same as get_sg_assets but retrieve the Assets page by page, yielding
+        each SgAsset as its page arrives. Memory stays bounded to about one
+        page while the next page is fetched in the background.
+
+        Parameters
+        ----------
+        asset_id : int | set[int] | list[int]
+            ShotGrid Asset ID. Default None which retrieve all Assets
+        custom_fields: list[str]
+            List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
+        page_size : int
+            Number of Assets per request. Default and maximum 500
+
+        Yields
+        ------
+        SgAsset
+
+        """
+        filters = self._get_id_filters(asset_id)
+
+        fields = ASSET_MINIMAL_FIELDS if minimal else ASSET_FIELDS
+        if custom_fields:
+            fields = custom_fields
+
+        yield from self._iter_find(SgAsset, SgEntity.ASSET, filters, fields, page_size=page_size)
+
     def create_sg_asset(self, data: SgAsset, **kwargs) -> int:
         """Create SG Asset
 
@@ -1612,9 +2232,7 @@ class Konbini:
 
         """
         if data.sg_status_list:
-            valid_values = self.get_valid_values(SgEntity.ASSET, "sg_status_list")
-            if data.sg_status_list not in valid_values:
-                raise Exception(f"Invalid {data.sg_status_list} value! Valid values: {valid_values}")
+            self._validate_value(SgEntity.ASSET, "sg_status_list", data.sg_status_list)
 
         data_ = data.to_dict()
         data_.update(**kwargs)
@@ -1624,7 +2242,7 @@ class Konbini:
             response_data = self.sg.create(SgEntity.ASSET, data_)
             created_id = response_data["id"]
             logger.info(f"SgAsset {created_id} successfully created")
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError) as e:
+        except (Fault, ShotgunError) as e:
             logger.error(
                 {
                     "msg": "Fail to create SG Asset",
@@ -1632,8 +2250,6 @@ class Konbini:
                     "data": data,
                 }
             )
-        except Exception as e:
-            logger.error(f"Unhandled exception when creating SgAsset {data.code}: {e}")
 
         return created_id
 
@@ -1652,15 +2268,13 @@ class Konbini:
 
         """
         if not isinstance(data, SgAsset):
-            raise Exception("Data must be instance of SgAsset!")
+            raise TypeError("Data must be instance of SgAsset!")
 
         if not data.id:
-            raise Exception("No SgAsset ID found!")
+            raise ValueError("No SgAsset ID found!")
 
         if data.sg_status_list:
-            valid_values = self.get_valid_values(SgEntity.ASSET, "sg_status_list")
-            if data.sg_status_list not in valid_values:
-                raise Exception(f"Invalid {data.sg_status_list} value! Valid values: {valid_values}")
+            self._validate_value(SgEntity.ASSET, "sg_status_list", data.sg_status_list)
 
         is_updated = True
         data_ = data.to_dict()
@@ -1673,7 +2287,7 @@ class Konbini:
                 data=data_,
             )
             logger.info(f"Update Asset {data.id} successful")
-        except shotgun_api3.ShotgunError as e:
+        except ShotgunError as e:
             logger.error(f"Error updating Asset {data.id}: {e}")
             is_updated = False
 
@@ -1683,6 +2297,7 @@ class Konbini:
             self,
             shot_id: Union[int, Set[int], List[int]] = None,
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
     ) -> List[SgShot]:
         """Get SG Shots
 
@@ -1692,6 +2307,8 @@ class Konbini:
             ShotGrid Project ID. Default None which retrieve all Shots
         custom_fields: list[str]
             List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
 
         Returns
         -------
@@ -1701,11 +2318,7 @@ class Konbini:
         """
         filters = []
         if shot_id:
-            if isinstance(shot_id, int):
-                shot_id = [shot_id]
-
-            if isinstance(shot_id, set):
-                shot_id = list(shot_id)
+            shot_id = self._as_id_list(shot_id)
 
             filters = [
                 [
@@ -1715,18 +2328,56 @@ class Konbini:
                 ]
             ]
 
-        fields = SHOT_FIELDS
+        fields = SHOT_MINIMAL_FIELDS if minimal else SHOT_FIELDS
         if custom_fields:
             fields = custom_fields
 
         shots_: List[dict] = self.sg.find(SgEntity.SHOT, filters, fields)
-        shots = [SgProject.from_dict(_) for _ in shots_]
+        shots = list(map(SgShot.from_dict, shots_))
         return shots
 
+    def iter_sg_shots(
+            self,
+            shot_id: Optional[Union[int, Set[int], List[int]]] = None,
+            custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
+            page_size: int = PAGE_SIZE,
+    ) -> Iterator[SgShot]:
+        """Iterate SG Shots
+
+        Same as get_sg_shots but retrieve the Shots page by page, yielding
+        each SgShot as its page arrives. Memory stays bounded to about one
+        page while the next page is fetched in the background.
+
+        Parameters
+        ----------
+        shot_id : int | set[int] | list[int]
+            ShotGrid Shot ID. Default None which retrieve all Shots
+        custom_fields: list[str]
+            List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
+        page_size : int
+            Number of Shots per request. Default and maximum 500
+
+        Yields
+        ------
+        SgShot
+
+        """
+        filters = self._get_id_filters(shot_id)
+
+        fields = SHOT_MINIMAL_FIELDS if minimal else SHOT_FIELDS
+        if custom_fields:
+            fields = custom_fields
+
+        yield from self._iter_find(SgShot, SgEntity.SHOT, filters, fields, page_size=page_size)
+
     def get_sg_shots_by_project(
             self,
             project_id: int,
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
     ) -> List[SgShot]:
         """Get SG Shots
         
@@ -1736,6 +2387,8 @@ class Konbini:
             ShotGrid Project ID.
         custom_fields: list[str]
             List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
         
         Returns
         -------
@@ -1743,25 +2396,49 @@ class Konbini:
             List of SgShot or empty list if no results from ShotGrid
             
         """
-        filters = [
-            [
-                "project",
-                "is",
-                [
-                    {
-                        "id": project_id,
-                        "type": SgEntity.PROJECT,
-                    }
-                ]
-            ]
-        ]
-        fields = SHOT_FIELDS
+        filters = self._get_project_filters(project_id)
+        fields = SHOT_MINIMAL_FIELDS if minimal else SHOT_FIELDS
+        if custom_fields:
+            fields = custom_fields
+
+        shots_ = self.sg.find(SgEntity.SHOT, filters, fields)
+        shots = list(map(SgShot.from_dict, shots_))
+        return shots
+
+    def iter_sg_shots_by_project(
+            self,
+            project_id: int,
+            custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
+            page_size: int = PAGE_SIZE,
+    ) -> Iterator[SgShot]:
+        """Iterate SG Shots by Project
+
+        Same as get_sg_shots_by_project but retrieve the Shots page by page,
+        yielding each SgShot as its page arrives.
+
+        Parameters
+        ----------
+        project_id : int
+            ShotGrid Project ID.
+        custom_fields: list[str]
+            List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
+        page_size : int
+            Number of Shots per request. Default and maximum 500
+
+        Yields
+        ------
+        SgShot
+
+        """
+        filters = self._get_project_filters(project_id)
+        fields = SHOT_MINIMAL_FIELDS if minimal else SHOT_FIELDS
         if custom_fields:
             fields = custom_fields
 
-        shots_ = self.sg.find(SgEntity.SHOT, filters, fields)
-        shots = [SgShot.from_dict(s) for s in shots_]
-        return shots
+        yield from self._iter_find(SgShot, SgEntity.SHOT, filters, fields, page_size=page_size)
 
     def create_sg_shot(self, data: SgShot, **kwargs) -> int:
         """Create SG Shot
@@ -1791,9 +2468,7 @@ class Konbini:
             }
         """
         if data.sg_status_list:
-            valid_values = self.get_valid_values(SgEntity.SHOT, "sg_status_list")
-            if data.sg_status_list not in valid_values:
-                raise Exception(f"Invalid {data.sg_status_list} value! Valid values: {valid_values}")
+            self._validate_value(SgEntity.SHOT, "sg_status_list", data.sg_status_list)
 
         data_ = data.to_dict()
         data_.update(**kwargs)
@@ -1803,7 +2478,7 @@ class Konbini:
             response_data = self.sg.create(SgEntity.SHOT, data_)
             created_id = response_data["id"]
             logger.info(f"SgShot {created_id} successfully created")
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError) as e:
+        except (Fault, ShotgunError) as e:
             logger.error(
                 {
                     "msg": "Fail to create SG Shot",
@@ -1811,8 +2486,6 @@ class Konbini:
                     "data": data,
                 }
             )
-        except Exception as e:
-            logger.error(f"Unhandled exception when creating SgShot {data.code}: {e}")
 
         return created_id
 
@@ -1831,15 +2504,13 @@ class Konbini:
 
         """
         if not isinstance(data, SgShot):
-            raise Exception("Data must be instance of SgShot!")
+            raise TypeError("Data must be instance of SgShot!")
 
         if not data.id:
-            raise Exception("No SgShot ID found!")
+            raise ValueError("No SgShot ID found!")
 
         if data.sg_status_list:
-            valid_values = self.get_valid_values(SgEntity.SHOT, "sg_status_list")
-            if data.sg_status_list not in valid_values:
-                raise Exception(f"Invalid {data.sg_status_list} value! Valid values: {valid_values}")
+            self._validate_value(SgEntity.SHOT, "sg_status_list", data.sg_status_list)
 
         is_updated = True
         data_ = data.to_dict()
@@ -1852,7 +2523,7 @@ class Konbini:
                 data=data_,
             )
             logger.info(f"Update Shot {data.id} successful")
-        except shotgun_api3.ShotgunError as e:
+        except ShotgunError as e:
             logger.error(f"Error updating Shot {data.id}: {e}")
             is_updated = False
 
@@ -1862,6 +2533,7 @@ class Konbini:
             self,
             task_id: Union[int, Set[int], List[int]] = None,
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
     ) -> List[SgTask]:
         """Get SG Tasks
 
@@ -1871,6 +2543,8 @@ class Konbini:
             ShotGrid Task ID. Default None which retrieve all Tasks
         custom_fields: list[str]
             List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
 
         Returns
         -------
@@ -1884,11 +2558,7 @@ class Konbini:
         """
         filters = []
         if task_id:
-            if isinstance(task_id, int):
-                task_id = [task_id]
-
-            if isinstance(task_id, set):
-                task_id = list(task_id)
+            task_id = self._as_id_list(task_id)
 
             filters = [
                 [
@@ -1898,15 +2568,56 @@ class Konbini:
                 ]
             ]
 
-        fields = TASK_FIELDS
+        fields = TASK_MINIMAL_FIELDS if minimal else TASK_FIELDS
         if custom_fields:
             fields = custom_fields
 
         # If content is 'Idle', the entity value will be None
         tasks_: List[dict] = self.sg.find(SgEntity.TASK, filters, fields)
-        tasks = [SgTask.from_dict(t) for t in tasks_]
+        tasks = list(map(SgTask.from_dict, tasks_))
         return tasks
 
+    def iter_sg_tasks(
+            self,
+            task_id: Optional[Union[int, Set[int], List[int]]] = None,
+            custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
+            page_size: int = PAGE_SIZE,
+    ) -> Iterator[SgTask]:
+        """Iterate SG Tasks
+
+        Same as get_sg_tasks but retrieve the Tasks page by page, yielding
+        each SgTask as its page arrives. Memory stays bounded to about one
+        page while the next page is fetched in the background.
+
+        Parameters
+        ----------
+        task_id : int | set[int] | list[int]
+            ShotGrid Task ID. Default None which retrieve all Tasks
+        custom_fields: list[str]
+            List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
+        page_size : int
+            Number of Tasks per request. Default and maximum 500
+
+        Yields
+        ------
+        SgTask
+
+        Notes
+        -----
+        If content is 'Idle' or 'Report', the entity value will be None
+
+        """
+        filters = self._get_id_filters(task_id)
+
+        fields = TASK_MINIMAL_FIELDS if minimal else TASK_FIELDS
+        if custom_fields:
+            fields = custom_fields
+
+        yield from self._iter_find(SgTask, SgEntity.TASK, filters, fields, page_size=page_size)
+
     def create_sg_task(self, data: SgTask, **kwargs) -> int:
         """Create SG Task
 
@@ -1942,9 +2653,7 @@ class Konbini:
 
         """
         if data.sg_status_list:
-            valid_values = self.get_valid_values(SgEntity.TASK, "sg_status_list")
-            if data.sg_status_list not in valid_values:
-                raise Exception(f"Invalid {data.sg_status_list} value! Valid values: {valid_values}")
+            self._validate_value(SgEntity.TASK, "sg_status_list", data.sg_status_list)
 
         data_ = data.to_dict()
         data_.update(**kwargs)
@@ -1954,7 +2663,7 @@ class Konbini:
             response_data = self.sg.create(SgEntity.TASK, data_)
             created_id = response_data["id"]
             logger.info(f"SgTask {created_id} successfully created")
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError) as e:
+        except (Fault, ShotgunError) as e:
             logger.error(
                 {
                     "msg": "Fail to create SG task",
@@ -1962,8 +2671,6 @@ class Konbini:
                     "data": data,
                 }
             )
-        except Exception as e:
-            logger.error(f"Unhandled exception when creating SgTask {data.name}: {e}")
 
         return created_id
 
@@ -1982,15 +2689,13 @@ class Konbini:
 
         """
         if not isinstance(data, SgTask):
-            raise Exception("Data must be instance of SgTask!")
+            raise TypeError("Data must be instance of SgTask!")
 
         if not data.id:
-            raise Exception("No SgTask ID found!")
+            raise ValueError("No SgTask ID found!")
 
         if data.sg_status_list:
-            valid_values = self.get_valid_values(SgEntity.TASK, "sg_status_list")
-            if data.sg_status_list not in valid_values:
-                raise Exception(f"Invalid {data.sg_status_list} value! Valid values: {valid_values}")
+            self._validate_value(SgEntity.TASK, "sg_status_list", data.sg_status_list)
 
         is_updated = True
         data_ = data.to_dict()
@@ -2003,7 +2708,7 @@ class Konbini:
                 data=data_,
             )
             logger.info(f"Update Task {data.id} successful")
-        except shotgun_api3.ShotgunError as e:
+        except ShotgunError as e:
             logger.error(f"Error updating Task {data.id}: {e}")
             is_updated = False
 
@@ -2013,7 +2718,7 @@ class Konbini:
             self,
             task_id: List[int],
             status: str,
-    ) -> bool:
+    ) -> BulkResult:
         """Bulk Update SG Task Status
 
         Parameters
@@ -2025,46 +2730,59 @@ class Konbini:
 
         Returns
         -------
-        bool
-            True if bulk update successfully
+        BulkResult
+            Truthy if bulk update successfully. The response holds the updated
+            Task dicts and failed_ids holds the Task IDs that were not updated
+
+        Notes
+        -----
+        The requests are sent in chunks of BATCH_SIZE. sg.batch is transactional
+        per chunk so a failed chunk does not roll back the chunks before it.
 
         """
-        valid_values = self.get_valid_values(SgEntity.TASK, "sg_status_list")
-        if status not in valid_values:
-            raise Exception(f"Invalid {status} value! Valid values: {valid_values}")
+        if not task_id:
+            return BulkResult()
 
-        batch_data = []
-        for _id in task_id:
-            request_data = {
-                "request_type": "update",
-                "entity_id": _id,
-                "entity_type": SgEntity.TASK,
-                "data": {
-                    "sg_status_list": status
-                },
-            }
-            batch_data.append(request_data)
+        self._validate_value(SgEntity.TASK, "sg_status_list", status)
 
-        is_bulk_updated = True
+        # Drop duplicate IDs (order preserved) to avoid redundant update requests
+        task_id = list(dict.fromkeys(task_id))
 
-        try:
-            self.sg.batch(batch_data)
-        except Exception as e:
-            logger.error(
-                {
-                    "msg": "Unexpected error in bulk updating tasks status",
-                    "error": e,
-                    "task_id": task_id,
-                }
-            )
-            is_bulk_updated = False
+        # Only entity_id differs between requests so merge it into a shared template
+        request_template = {
+            "request_type": "update",
+            "entity_type": SgEntity.TASK,
+            "data": {
+                "sg_status_list": status
+            },
+        }
+        batch_data = [{**request_template, "entity_id": _id} for _id in task_id]
+
+        result = BulkResult()
+
+        for chunk in self._batched(batch_data, self.BATCH_SIZE):
+            chunk_ids = [request["entity_id"] for request in chunk]
+            try:
+                result.response.extend(self.sg.batch(chunk))
+            except (Fault, ShotgunError, HttpLib2Error, OSError) as e:
+                logger.error(
+                    {
+                        "msg": "Unexpected error in bulk updating tasks status",
+                        "error": e,
+                        "task_id": chunk_ids,
+                    }
+                )
+                # sg.batch is transactional so nothing in the chunk is updated
+                result.ok = False
+                result.failed_ids.extend(chunk_ids)
 
-        return is_bulk_updated
+        return result
 
     def get_sg_versions(
             self,
             version_id: Union[int, Set[int], List[int]] = None,
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
     ) -> List[SgVersion]:
         """Get SG Versions
 
@@ -2074,6 +2792,8 @@ class Konbini:
             ShotGrid Version ID. Default None which retrieve all Versions
         custom_fields: list[str]
             Optional. List of valid fields for SG Version.
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
 
         Returns
         -------
@@ -2083,12 +2803,7 @@ class Konbini:
         """
         filters = []
         if version_id:
-            if isinstance(version_id, int):
-                version_id = [version_id]
-
-            if isinstance(version_id, set):
-                version_id = list(version_id)
-
+            version_id = self._as_id_list(version_id)
             filters = [
                 [
                     "id",
@@ -2097,15 +2812,52 @@ class Konbini:
                 ]
             ]
 
-        fields = VERSION_FIELDS
+        fields = VERSION_MINIMAL_FIELDS if minimal else VERSION_FIELDS
         if custom_fields:
             fields = custom_fields
 
         # If content is 'Idle', the entity value will be None
         versions_: List[dict] = self.sg.find(SgEntity.VERSION, filters, fields)
-        versions = [SgVersion.from_dict(t) for t in versions_]
+        versions = list(map(SgVersion.from_dict, versions_))
         return versions
 
+    def iter_sg_versions(
+            self,
+            version_id: Optional[Union[int, Set[int], List[int]]] = None,
+            custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
+            page_size: int = PAGE_SIZE,
+    ) -> Iterator[SgVersion]:
+        """Iterate SG Versions
+
+        Same as get_sg_versions but retrieve the Versions page by page, yielding
+        each SgVersion as its page arrives. Memory stays bounded to about one
+        page while the next page is fetched in the background.
+
+        Parameters
+        ----------
+        version_id : int | set[int] | list[int]
+            ShotGrid Version ID. Default None which retrieve all Versions
+        custom_fields: list[str]
+            List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
+        page_size : int
+            Number of Versions per request. Default and maximum 500
+
+        Yields
+        ------
+        SgVersion
+
+        """
+        filters = self._get_id_filters(version_id)
+
+        fields = VERSION_MINIMAL_FIELDS if minimal else VERSION_FIELDS
+        if custom_fields:
+            fields = custom_fields
+
+        yield from self._iter_find(SgVersion, SgEntity.VERSION, filters, fields, page_size=page_size)
+
     def create_sg_version(self, data: SgVersion, **kwargs) -> int:
         """Create SG Version
 
@@ -2141,9 +2893,7 @@ class Konbini:
 
         """
         if data.sg_status_list:
-            valid_values = self.get_valid_values(SgEntity.VERSION, "sg_status_list")
-            if data.sg_status_list not in valid_values:
-                raise Exception(f"Invalid {data.sg_status_list} value! Valid values: {valid_values}")
+            self._validate_value(SgEntity.VERSION, "sg_status_list", data.sg_status_list)
 
         data_ = data.to_dict()
         data_.update(**kwargs)
@@ -2153,7 +2903,7 @@ class Konbini:
             response_data = self.sg.create(SgEntity.VERSION, data_)
             created_id = response_data["id"]
             logger.info(f"SgVersion {created_id} successfully created")
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError) as e:
+        except (Fault, ShotgunError) as e:
             logger.error(
                 {
                     "msg": "Fail to create SG Version",
@@ -2161,8 +2911,6 @@ class Konbini:
                     "data": data,
                 }
             )
-        except Exception as e:
-            logger.error(f"Unhandled exception when creating SgVersion {data.code}: {e}")
 
         return created_id
 
@@ -2181,10 +2929,10 @@ class Konbini:
 
         """
         if not isinstance(data, SgVersion):
-            raise Exception("Data must be instance of SgVersion!")
+            raise TypeError("Data must be instance of SgVersion!")
 
         if not data.id:
-            raise Exception("No SgVersion ID found!")
+            raise ValueError("No SgVersion ID found!")
 
         is_successful_update = True
         data_ = data.to_dict()
@@ -2194,10 +2942,10 @@ class Konbini:
             self.sg.update(
                 entity_type=SgEntity.VERSION,
                 entity_id=data.id,
-                data=data.to_dict(),
+                data=data_,
             )
             logger.info(f"Update SG Version {data.id} successful")
-        except shotgun_api3.ShotgunError as e:
+        except ShotgunError as e:
             logger.warning(f"Error updating SG Version {data.id}: {e}")
             is_successful_update = False
 
@@ -2207,6 +2955,7 @@ class Konbini:
             self,
             timelog_id: Union[int, Set[int], List[int]] = None,
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
     ) -> List[dict]:
         """Get SG Timelogs
 
@@ -2216,6 +2965,8 @@ class Konbini:
             The SG Timelog ID. Default None which retrieve all TimeLogs
         custom_fields : list[str]
             List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
 
         Returns
         -------
@@ -2225,11 +2976,7 @@ class Konbini:
         """
         filters = []
         if timelog_id:
-            if isinstance(timelog_id, int):
-                timelog_id = [timelog_id]
-
-            if isinstance(timelog_id, set):
-                timelog_id = list(timelog_id)
+            timelog_id = self._as_id_list(timelog_id)
 
             filters = [
                 [
@@ -2239,18 +2986,56 @@ class Konbini:
                 ]
             ]
 
-        fields = TIMELOG_FIELDS
+        fields = TIMELOG_MINIMAL_FIELDS if minimal else TIMELOG_FIELDS
         if custom_fields:
             fields = custom_fields
 
         timelogs_ = self.sg.find(SgEntity.TIMELOG, filters, fields)
-        timelogs = [SgTimeLog.from_dict(t) for t in timelogs_]
+        timelogs = list(map(SgTimeLog.from_dict, timelogs_))
         return timelogs
 
+    def iter_sg_timelogs(
+            self,
+            timelog_id: Optional[Union[int, Set[int], List[int]]] = None,
+            custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
+            page_size: int = PAGE_SIZE,
+    ) -> Iterator[SgTimeLog]:
+        """Iterate SG Timelogs
+
+        Same as get_sg_timelogs but retrieve the TimeLogs page by page, yielding
+        each SgTimeLog as its page arrives. Memory stays bounded to about one
+        page while the next page is fetched in the background.
+
+        Parameters
+        ----------
+        timelog_id : int | set[int] | list[int]
+            The SG Timelog ID. Default None which retrieve all TimeLogs
+        custom_fields : list[str]
+            List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
+        page_size : int
+            Number of TimeLogs per request. Default and maximum 500
+
+        Yields
+        ------
+        SgTimeLog
+
+        """
+        filters = self._get_id_filters(timelog_id)
+
+        fields = TIMELOG_MINIMAL_FIELDS if minimal else TIMELOG_FIELDS
+        if custom_fields:
+            fields = custom_fields
+
+        yield from self._iter_find(SgTimeLog, SgEntity.TIMELOG, filters, fields, page_size=page_size)
+
     def get_sg_timelogs_by_user(
             self,
             humanuser_id: Union[int, Set[int], List[int]],
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
     ) -> List[dict]:
         """Get SG Timelogs
 
@@ -2260,6 +3045,8 @@ class Konbini:
             The SG HumanUser ID
         custom_fields : list[str]
             List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
 
         Returns
         -------
@@ -2267,16 +3054,7 @@ class Konbini:
             List of SgTimeLog or empty list if no results from ShotGrid
 
         """
-        if isinstance(humanuser_id, int):
-            humanuser_id = [humanuser_id]
-
-        if isinstance(humanuser_id, set):
-            humanuser_id = list(humanuser_id)
-
-        users = [
-            {"id": _, "type": SgEntity.HUMANUSER}
-            for _ in humanuser_id
-        ]
+        users = self._as_user_refs(self._as_id_list(humanuser_id))
         filters = [
             [
                 "user",
@@ -2284,12 +3062,12 @@ class Konbini:
                 users,
             ]
         ]
-        fields = TIMELOG_FIELDS
+        fields = TIMELOG_MINIMAL_FIELDS if minimal else TIMELOG_FIELDS
         if custom_fields:
             fields = custom_fields
 
         timelogs_ = self.sg.find(SgEntity.TIMELOG, filters, fields)
-        timelogs = [SgTimeLog.from_dict(t) for t in timelogs_]
+        timelogs = list(map(SgTimeLog.from_dict, timelogs_))
         return timelogs
 
     def create_sg_timelog(self, data: SgTimeLog, **kwargs) -> int:
@@ -2339,7 +3117,7 @@ class Konbini:
             response_data = self.sg.create(SgEntity.TIMELOG, data_)
             created_id = response_data["id"]
             logger.info(f"SgTimeLog {created_id} successfully created")
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError) as e:
+        except (Fault, ShotgunError) as e:
             logger.error(
                 {
                     "msg": "Fail to create SG Timelog",
@@ -2347,18 +3125,18 @@ class Konbini:
                     "data": data,
                 }
             )
-        except Exception as e:
-            logger.error(f"Unhandled exception when creating SgTimeLog: {e}")
 
         return created_id
 
-    def bulk_create_sg_timelog(self, batch_data: List[dict]) -> List[dict]:
+    def bulk_create_sg_timelog(self, batch_data: List[dict], max_workers: int = 4) -> List[dict]:
         """Bulk Create Timelog
 
         Parameters
         ----------
         batch_data : list[dict]
             list of Timelog dict for bulk create
+        max_workers : int
+            Maximum number of chunks sent concurrently. Default 4
 
         Returns
         -------
@@ -2367,19 +3145,55 @@ class Konbini:
 
         Raises
         ------
-        shotgun_api3.ShotgunError
+        konbinine.exceptions.BulkCreateError
+            If any chunk fails. A shotgun_api3.ShotgunError subclass with the
+            TimeLogs created by the other chunks in response and the requests
+            of the failed chunks in failed_data
+
+        Notes
+        -----
+        The requests are sent in chunks of BATCH_SIZE and up to max_workers
+        chunks are in flight at once. If a chunk fails, the TimeLogs created by
+        the other chunks are kept.
 
         """
-        try:
-            batch_response = self.sg.batch(batch_data)
-        except shotgun_api3.ShotgunError as e:
+        if not batch_data:
+            return []
+
+        def send_chunk(chunk: List[dict]) -> Tuple[list, Optional[Exception]]:
+            # Keep the error per chunk so the other chunks' results are not lost
+            try:
+                return self.sg.batch(chunk), None
+            except (Fault, ShotgunError, HttpLib2Error, OSError) as e:
+                return [], e
+
+        chunks = list(self._batched(batch_data, self.BATCH_SIZE))
+        results = self._map_parallel(send_chunk, chunks, max_workers)
+
+        batch_response = []
+        failed_data = []
+        first_error = None
+        for chunk, (response, error) in zip(chunks, results):
+            if error is None:
+                batch_response.extend(response)
+                continue
+
             logger.error(
                 {
                     "msg": "Unexpected error in bulk create timelogs",
-                    "error": e,
+                    "error": error,
+                    "failed_count": len(chunk),
                 }
             )
-            raise e
+            failed_data.extend(chunk)
+            first_error = first_error or error
+
+        if failed_data:
+            raise BulkCreateError(
+                f"Failed to create {len(failed_data)} of {len(batch_data)} timelogs",
+                response=batch_response,
+                failed_data=failed_data,
+            ) from first_error
 
         return batch_response
 
@@ -2398,10 +3212,10 @@ class Konbini:
 
         """
         if not isinstance(data, SgTimeLog):
-            raise Exception("Data must be instance of SgTimeLog!")
+            raise TypeError("Data must be instance of SgTimeLog!")
 
         if not data.id:
-            raise Exception("No SgTimeLog ID found!")
+            raise ValueError("No SgTimeLog ID found!")
 
         is_successful_update = True
         data_ = data.to_dict()
@@ -2411,10 +3225,10 @@ class Konbini:
             self.sg.update(
                 entity_type=SgEntity.TIMELOG,
                 entity_id=data.id,
-                data=data.to_dict(),
+                data=data_,
             )
             logger.info(f"Update Timelog {data.id} successful")
-        except shotgun_api3.ShotgunError as e:
+        except ShotgunError as e:
             logger.warning(f"Error updating Timelog {data.id}: {e}")
             is_successful_update = False
 
@@ -2438,13 +3252,13 @@ class Konbini:
         """
         try:
             is_deleted = self.sg.delete(SgEntity.TIMELOG, timelog_id)
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError) as e:
+        except (Fault, ShotgunError) as e:
             logger.warning(f"Error deleting Timelog {timelog_id}: {e}")
             is_deleted = False
 
         return is_deleted
 
-    def bulk_delete_sg_timelog(self, timelog_id: Union[int, List[int]]) -> bool:
+    def bulk_delete_sg_timelog(self, timelog_id: Union[int, List[int]]) -> BulkResult:
         """Bulk Delete Timelog
 
         Bulk delete SG TimeLog entities.
@@ -2456,40 +3270,57 @@ class Konbini:
 
         Returns
         -------
-        bool
-            True if bulk delete successfully
+        BulkResult
+            Truthy if bulk delete successfully. The failed_ids holds the TimeLog
+            IDs that were not deleted
 
         """
-        timelog_ids = list(timelog_id)
-        batch_data = []
-        for _id in timelog_ids:
-            request_data = {
-                "request_type": "delete",
-                "entity_id": _id,
-                "entity_type": SgEntity.TIMELOG,
-            }
-            batch_data.append(request_data)
+        timelog_ids = list(dict.fromkeys(self._as_id_list(timelog_id)))
+        if not timelog_ids:
+            return BulkResult()
 
-        is_bulk_delete_timelog_successful = True
+        request_template = {
+            "request_type": "delete",
+            "entity_type": SgEntity.TIMELOG,
+        }
+        batch_data = [{**request_template, "entity_id": _id} for _id in timelog_ids]
 
-        try:
-            self.sg.batch(batch_data)
-        except Exception as e:
-            logger.error(
-                {
-                    "msg": " Unexpected error in bulk deleting timelog",
-                    "error": e,
-                    "timelog_ids": timelog_ids,
-                }
+        result = BulkResult()
+
+        for chunk in self._batched(batch_data, self.BATCH_SIZE):
+            chunk_ids = [request["entity_id"] for request in chunk]
+            try:
+                response = self.sg.batch(chunk)
+            except (Fault, ShotgunError, HttpLib2Error, OSError) as e:
+                logger.error(
+                    {
+                        "msg": " Unexpected error in bulk deleting timelog",
+                        "error": e,
+                        "timelog_ids": chunk_ids,
+                    }
+                )
+                result.failed_ids.extend(chunk_ids)
+                continue
+
+            result.response.extend(response)
+
+            # Delete requests respond with True/False per TimeLog ID
+            result.failed_ids.extend(
+                _id for _id, is_deleted in zip(chunk_ids, response)
+                if not is_deleted
             )
-            is_bulk_delete_timelog_successful = False
 
-        return is_bulk_delete_timelog_successful
+        result.ok = not result.failed_ids
+
+        return result
 
     def get_sg_attachments(
             self,
             attachment_id: Optional[Union[int, Set[int], List[int]]] = None,
             custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
+            chunk_size: int = PAGE_SIZE,
+            max_workers: int = 4,
     ) -> List[SgAttachment]:
         """Get SG Attachments
 
@@ -2499,6 +3330,13 @@ class Konbini:
             ShotGrid Attachment ID. Default None which retrieve all Attachments
         custom_fields : list[str]
             List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
+        chunk_size : int
+            Maximum number of IDs per find. Larger ID lists are split and the
+            finds run concurrently. Default 500
+        max_workers : int
+            Maximum number of concurrent finds. Default 4
 
         Returns
         -------
@@ -2506,35 +3344,164 @@ class Konbini:
             List of SgAttachment or empty list if no results from ShotGrid
 
         """
-        filters = []
+        fields = ATTACHMENT_MINIMAL_FIELDS if minimal else ATTACHMENT_FIELDS
+        if custom_fields:
+            fields = custom_fields
+
         if attachment_id:
-            if isinstance(attachment_id, int):
-                attachment_id = [attachment_id]
+            attachments_ = self._find_by_ids(
+                SgEntity.ATTACHMENT,
+                self._as_id_list(attachment_id),
+                fields,
+                chunk_size,
+                max_workers,
+            )
+        else:
+            attachments_ = self.sg.find(SgEntity.ATTACHMENT, [], fields)
 
-            if isinstance(attachment_id, set):
-                attachment_id = list(attachment_id)
+        attachments = list(map(SgAttachment.from_dict, attachments_))
+        return attachments
 
-            filters = [
-                [
-                    "id",
-                    "in",
-                    attachment_id
-                ]
-            ]
+    def iter_sg_attachments(
+            self,
+            attachment_id: Optional[Union[int, Set[int], List[int]]] = None,
+            custom_fields: Optional[List[str]] = None,
+            minimal: bool = False,
+            page_size: int = PAGE_SIZE,
+    ) -> Iterator[SgAttachment]:
+        """Iterate SG Attachments
+
+        Same as get_sg_attachments but retrieve the Attachments page by page,
+        yielding each SgAttachment as its page arrives. Memory stays bounded to
+        about one page while the next page is fetched in the background.
+
+        Parameters
+        ----------
+        attachment_id : int | set[int] | list[int]
+            ShotGrid Attachment ID. Default None which retrieve all Attachments
+        custom_fields : list[str]
+            List of custom fields
+        minimal : bool
+            Request the minimal default fields instead. Ignored if custom_fields is provided
+        page_size : int
+            Number of Attachments per request. Default and maximum 500
+
+        Yields
+        ------
+        SgAttachment
+
+        """
+        filters = self._get_id_filters(attachment_id)
 
-        fields = ATTACHMENT_FIELDS
+        fields = ATTACHMENT_MINIMAL_FIELDS if minimal else ATTACHMENT_FIELDS
         if custom_fields:
             fields = custom_fields
 
-        attachments_: List[dict] = self.sg.find(SgEntity.ATTACHMENT, filters, fields)
-        attachments = [SgAttachment.from_dict(_) for _ in attachments_]
-        return attachments
+        yield from self._iter_find(SgAttachment, SgEntity.ATTACHMENT, filters, fields, page_size=page_size)
+
+    def get_sg_bundle(
+            self,
+            asset_id: Optional[Union[int, Set[int], List[int]]] = None,
+            shot_id: Optional[Union[int, Set[int], List[int]]] = None,
+            task_id: Optional[Union[int, Set[int], List[int]]] = None,
+            version_id: Optional[Union[int, Set[int], List[int]]] = None,
+            timelog_id: Optional[Union[int, Set[int], List[int]]] = None,
+            minimal: bool = False,
+    ) -> Dict[str, list]:
+        """Get SG Bundle
+
+        Get Assets, Shots, Tasks, Versions and TimeLogs by IDs in one call.
+        sg.batch only accepts create, update and delete requests so each
+        entity type is still a find, but the finds run concurrently and the
+        total wait is roughly the slowest find instead of the sum.
+
+        Parameters
+        ----------
+        asset_id : int | set[int] | list[int]
+            ShotGrid Asset ID. Default None which skip Assets
+        shot_id : int | set[int] | list[int]
+            ShotGrid Shot ID. Default None which skip Shots
+        task_id : int | set[int] | list[int]
+            ShotGrid Task ID. Default None which skip Tasks
+        version_id : int | set[int] | list[int]
+            ShotGrid Version ID. Default None which skip Versions
+        timelog_id : int | set[int] | list[int]
+            ShotGrid TimeLog ID. Default None which skip TimeLogs
+        minimal : bool
+            Request the minimal default fields instead
+
+        Returns
+        -------
+        dict[str, list]
+            The results keyed by SgEntity (e.g. SgEntity.ASSET) for every
+            entity type requested
+
+        """
+        getters = {
+            SgEntity.ASSET: (self.get_sg_assets, asset_id),
+            SgEntity.SHOT: (self.get_sg_shots, shot_id),
+            SgEntity.TASK: (self.get_sg_tasks, task_id),
+            SgEntity.VERSION: (self.get_sg_versions, version_id),
+            SgEntity.TIMELOG: (self.get_sg_timelogs, timelog_id),
+        }
+        getters = {
+            entity: (getter, entity_id)
+            for entity, (getter, entity_id) in getters.items()
+            if entity_id
+        }
+        if not getters:
+            return {}
+
+        results = self.get_sg_parallel(
+            [
+                functools.partial(getter, entity_id, minimal=minimal)
+                for getter, entity_id in getters.values()
+            ],
+            max_workers=len(getters),
+        )
+        return dict(zip(getters, results))
+
+    def get_sg_parallel(
+            self,
+            calls: List[Callable[[], Any]],
+            max_workers: int = 8,
+    ) -> list:
+        """Get SG Parallel
+
+        Run independent Konbini calls concurrently on the shared thread pool. Each
+        worker thread uses its own SG client so the calls do not share a
+        connection.
+
+        Parameters
+        ----------
+        calls : list[Callable[[], Any]]
+            Zero-argument callables (e.g. lambda or functools.partial)
+        max_workers : int
+            Maximum number of concurrent calls. Default 8
+
+        Returns
+        -------
+        list
+            The results in the same order as calls
+
+        Examples
+        --------
+        assets, shots = kon.get_sg_parallel(
+            [
+                lambda: kon.get_sg_assets(asset_ids),
+                lambda: kon.get_sg_shots(shot_ids),
+            ]
+        )
+
+        """
+        return self._map_parallel(lambda call: call(), calls, max_workers)
 
     def upload_attachment(
             self,
             entity_id: int,
             entity_type: str,
             attachment_file: str,
+            skip_if_attached: bool = False,
             **kwargs,
     ) -> int:
         """Upload attachment
@@ -2553,6 +3520,9 @@ class Konbini:
             The entity type (e.g. 'Shot', 'Asset', etc.)
         attachment_file : str
             The attachment file path
+        skip_if_attached : bool
+            If True, return the ID of an existing Attachment linked to the entity
+            with the same file name instead of uploading it again
 
         Returns
         -------
@@ -2561,14 +3531,29 @@ class Konbini:
 
         """
         attachment_id = 0
+        if not self._is_uploadable(attachment_file):
+            return attachment_id
+
         try:
+            if skip_if_attached:
+                existing = self.sg.find_one(
+                    SgEntity.ATTACHMENT,
+                    [
+                        ["attachment_links", "is", {"type": entity_type, "id": entity_id}],
+                        ["original_fname", "is", os.path.basename(attachment_file)],
+                    ],
+                    ["id"],
+                )
+                if existing:
+                    return existing["id"]
+
             attachment_id = self.sg.upload(
                 entity_id=entity_id,
                 entity_type=entity_type,
                 path=attachment_file,
                 **kwargs,
             )
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError) as e:
+        except (Fault, ShotgunError) as e:
             logger.error(
                 {
                     "msg": "Fail to create SG Attachment",
@@ -2593,6 +3578,9 @@ class Konbini:
         sg_uploaded_movie field instead of image field. Correct me if I'm wrong by
         creating a GitHub issue!
 
+        Files large enough for a multipart upload have their parts sent concurrently,
+        see KonbiniShotgun.MULTIPART_UPLOAD_WORKERS.
+
         Parameters
         ----------
         entity_id : int
@@ -2609,6 +3597,9 @@ class Konbini:
 
         """
         attachment_id = 0
+        if not self._is_uploadable(attachment_file):
+            return attachment_id
+
         try:
             attachment_id = self.sg.upload(
                 entity_id=entity_id,
@@ -2617,7 +3608,7 @@ class Konbini:
                 field_name="sg_uploaded_movie",
                 **kwargs,
             )
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError) as e:
+        except (Fault, ShotgunError) as e:
             logger.error(
                 {
                     "msg": "Fail to upload movie",
@@ -2656,6 +3647,9 @@ class Konbini:
 
         """
         attachment_id = 0
+        if not self._is_uploadable(attachment_file):
+            return attachment_id
+
         try:
             attachment_id = self.sg.upload_thumbnail(
                 entity_id=entity_id,
@@ -2663,7 +3657,7 @@ class Konbini:
                 path=attachment_file,
                 **kwargs,
             )
-        except (shotgun_api3.Fault, shotgun_api3.ShotgunError) as e:
+        except (Fault, ShotgunError) as e:
             logger.error(
                 {
                     "msg": "Fail to upload thumbnail",
@@ -2673,3 +3667,144 @@ class Konbini:
             )
 
         return attachment_id
+
+    @staticmethod
+    def _is_uploadable(attachment_file: str) -> bool:
+        """Check the upload file locally before sending it to SG
+
+        A missing or empty file would only be rejected by SG after the request is
+        sent so skip the round trip for it.
+
+        Parameters
+        ----------
+        attachment_file : str
+            The attachment file path
+
+        Returns
+        -------
+        bool
+            True if the file exists and is not empty
+
+        """
+        try:
+            size = os.stat(attachment_file).st_size
+        except OSError as e:
+            logger.error(
+                {
+                    "msg": "Upload file is not accessible",
+                    "error": e,
+                    "attachment_file": attachment_file,
+                }
+            )
+            return False
+
+        if size == 0:
+            logger.error(
+                {
+                    "msg": "Upload file is empty",
+                    "attachment_file": attachment_file,
+                }
+            )
+            return False
+
+        return True
+
+    def upload_attachments(
+            self,
+            items: List[tuple],
+            max_workers: int = 8,
+    ) -> List[int]:
+        """Upload attachments
+
+        Same as upload_attachment but upload many files concurrently on a thread
+        pool.
+
+        Parameters
+        ----------
+        items : list[tuple]
+            (entity_id, entity_type, attachment_file) tuples. An optional fourth
+            item is a dict of kwargs for that upload (e.g. field_name)
+        max_workers : int
+            Maximum number of concurrent uploads. Default 8
+
+        Returns
+        -------
+        list[int]
+            The created attachment IDs in the same order as items. Failed
+            uploads are 0
+
+        """
+        return self._upload_many(self.upload_attachment, items, max_workers)
+
+    def upload_movies(
+            self,
+            items: List[tuple],
+            max_workers: int = 8,
+    ) -> List[int]:
+        """Upload movies
+
+        Same as upload_movie but upload many files concurrently on a thread
+        pool. Refer to upload_attachments for the items structure.
+
+        """
+        return self._upload_many(self.upload_movie, items, max_workers)
+
+    def upload_thumbnails(
+            self,
+            items: List[tuple],
+            max_workers: int = 8,
+    ) -> List[int]:
+        """Upload thumbnails
+
+        Same as upload_thumbnail but upload many files concurrently on a thread
+        pool. Refer to upload_attachments for the items structure.
+
+        """
+        return self._upload_many(self.upload_thumbnail, items, max_workers)
+
+    def _upload_many(
+            self,
+            upload: Callable[..., int],
+            items: List[tuple],
+            max_workers: int,
+    ) -> List[int]:
+        def upload_item(item: tuple) -> int:
+            entity_id, entity_type, attachment_file, *kwargs = item
+            return upload(entity_id, entity_type, attachment_file, **(kwargs[0] if kwargs else {}))
+
+        return self._map_parallel(upload_item, items, max_workers)
+
+    def upload_version_media(
+            self,
+            entity_id: int,
+            movie_path: str,
+            thumbnail_path: str,
+    ) -> Tuple[int, int]:
+        """Upload Version media
+
+        Upload the movie and thumbnail of a Version concurrently as they are
+        independent uploads.
+
+        Parameters
+        ----------
+        entity_id : int
+            The Version ID
+        movie_path : str
+            The movie file path. Refer to upload_movie
+        thumbnail_path : str
+            The thumbnail file path. Refer to upload_thumbnail
+
+        Returns
+        -------
+        tuple[int, int]
+            The movie and thumbnail attachment IDs. If error, the ID will be 0
+
+        """
+        movie_id, thumbnail_id = self.get_sg_parallel(
+            [
+                functools.partial(self.upload_movie, entity_id, SgEntity.VERSION, movie_path),
+                functools.partial(self.upload_thumbnail, entity_id, SgEntity.VERSION, thumbnail_path),
+            ],
+            max_workers=2,
+        )
+        return movie_id, thumbnail_id
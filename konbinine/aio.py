@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Coroutine, Iterator, Optional, Union
+
+from konbinine import Konbini
+
+
+class AsyncKonbini:
+    """Async facade for Konbini
+
+    Every public Konbini method is exposed with the same name and signature
+    but as a coroutine function, so independent SG calls can be awaited
+    together with asyncio.gather instead of blocking one after another.
+
+    The blocking call runs on a worker thread. Konbini hands out one SG client
+    per thread so the worker threads never share a connection.
+
+    The paged iter_* methods are exposed as async iterators instead and are
+    used with async for rather than awaited. Each batch of up to
+    Konbini.PAGE_SIZE entities is pulled on a worker thread so the SG finds
+    never block the event loop.
+
+    An existing Konbini can be wrapped with Konbini.as_async() to share its
+    settings and schema cache. If that Konbini has a client assigned
+    explicitly to Konbini.sg, the calls run one at a time on a single worker
+    thread as that one client is not thread-safe.
+
+    Examples
+    --------
+    async with AsyncKonbini() as akon:
+        projects, users = await asyncio.gather(
+            akon.get_sg_projects(),
+            akon.get_active_sg_humanusers(),
+        )
+        async for asset in akon.iter_sg_assets():
+            ...
+
+    """
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        script_name: Optional[str] = None,
+        api_key: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        konbini: Optional[Konbini] = None,
+    ):
+        if konbini is None:
+            konbini = Konbini(base_url, script_name, api_key)
+
+        # An explicitly assigned client would otherwise be shared by every worker
+        if konbini._sg is not None:
+            max_workers = 1
+
+        self.konbini = konbini
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="konbini",
+        )
+
+    def __getattr__(
+        self,
+        name: str,
+    ) -> Callable[..., Union[Coroutine[Any, Any, Any], AsyncIterator[Any]]]:
+        attr = getattr(Konbini, name, None)
+        if name.startswith("_") or not callable(attr):
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+        bound_method = getattr(self.konbini, name)
+
+        if name.startswith("iter_"):
+            # Creating the generator does not touch SG, iterating it does
+            def method(*args, **kwargs):
+                return self._iter_in_executor(bound_method(*args, **kwargs))
+
+        else:
+            async def method(*args, **kwargs):
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self._executor,
+                    functools.partial(bound_method, *args, **kwargs),
+                )
+
+        method.__name__ = name
+        method.__doc__ = attr.__doc__
+        return method
+
+    async def _iter_in_executor(self, iterator: Iterator[Any]) -> AsyncIterator[Any]:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await loop.run_in_executor(
+                self._executor,
+                list,
+                itertools.islice(iterator, self.konbini.PAGE_SIZE),
+            )
+            if not batch:
+                return
+
+            for item in batch:
+                yield item
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> AsyncKonbini:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -64,3 +64,12 @@ class SgEntity:
 class SgHumanUserStatus:
     ACTIVE = "act"
     DISABLED = "dis"
+
+
+class SgProjectStatus:
+    ACTIVE = "Active"
+
+
+class SgNoteStatus:
+    OPEN = "opn"
+    CLOSED = "clsd"
@@ -1,3 +1,6 @@
+from shotgun_api3 import ShotgunError
+
+
 class InvalidSgDateFormatException(Exception):
     pass
 
@@ -9,3 +12,16 @@ class MissingValueError(ValueError):
             f"environment variables or {missing_param_name} param."
         )
         super().__init__(_message, *args)
+
+
+class BulkCreateError(ShotgunError):
+    """Some chunks of a bulk create failed
+
+    response holds what the successful chunks created and failed_data the
+    requests of the failed chunks, so only those need to be retried.
+
+    """
+    def __init__(self, message: str, response: list, failed_data: list, *args):
+        super().__init__(message, *args)
+        self.response = response
+        self.failed_data = failed_data
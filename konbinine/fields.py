@@ -218,3 +218,90 @@ TIMELOG_FIELDS = [
     "project",
     "user",
 ]
+
+# Slimmer field sets for listings that only need to identify and link the
+# entities. Pass minimal=True to the getters to request these instead.
+# Booking and TimeLog keep their date fields as the models validate them.
+
+HUMANUSER_MINIMAL_FIELDS = [
+    "login",
+    "name",
+    "email",
+    "sg_status_list",
+]
+
+PROJECT_MINIMAL_FIELDS = [
+    "name",
+    "code",
+    "sg_status",
+]
+
+PIPELINE_STEP_MINIMAL_FIELDS = [
+    "code",
+    "short_name",
+    "entity_type",
+]
+
+TASK_MINIMAL_FIELDS = [
+    "content",
+    "task_assignees",
+    "entity",
+    "project",
+    "step",
+    "sg_status_list",
+]
+
+ASSET_MINIMAL_FIELDS = [
+    "code",
+    "project",
+    "sg_asset_type",
+    "sg_status_list",
+]
+
+SHOT_MINIMAL_FIELDS = [
+    "code",
+    "project",
+    "sg_status_list",
+]
+
+VERSION_MINIMAL_FIELDS = [
+    "code",
+    "entity",
+    "project",
+    "user",
+    "sg_task",
+    "sg_status_list",
+]
+
+ATTACHMENT_MINIMAL_FIELDS = [
+    "this_file",
+    "display_name",
+    "file_extension",
+]
+
+NOTE_MINIMAL_FIELDS = [
+    "subject",
+    "project",
+    "user",
+    "note_links",
+    "sg_status_list",
+]
+
+REPLY_MINIMAL_FIELDS = [
+    "content",
+    "user",
+    "entity",
+]
+
+BOOKING_MINIMAL_FIELDS = [
+    "user",
+    "start_date",
+    "end_date",
+]
+
+TIMELOG_MINIMAL_FIELDS = [
+    "date",
+    "duration",
+    "entity",
+    "user",
+]
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+import copy
 import datetime
-import inspect
-from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, List, Optional, Type
+from dataclasses import MISSING, dataclass, field, is_dataclass
+from typing import AbstractSet, Any, Dict, List, Optional, Type
 
 from konbinine.enums import SgEntity
 from konbinine.exceptions import (
@@ -12,12 +12,54 @@ from konbinine.exceptions import (
 from konbinine.types import TSgUploadedMovie
 from konbinine.utils import (
     get_current_utc_dt,
-    SG_DATE_FORMAT,
     validate_sg_date_format,
 )
 
 # TODO: Use Python 3.10+ kw_only but that is another headache for maintenance...
 
+# Canonical SgEntity strings. Every decoded row carries its own copy of the
+# entity type string so from_dict swaps it for the shared one.
+ENTITY_TYPES = {
+    v: v for k, v in vars(SgEntity).items()
+    if not k.startswith("_") and isinstance(v, str)
+}
+
+# Keys of a plain SG entity link, see SgGenericEntity.from_dict
+_GENERIC_ENTITY_KEYS = frozenset({"id", "name", "type"})
+
+# Not part of SG entity data so to_dict leaves them out
+TO_DICT_SKIPPED_FIELDS = frozenset({"id", "type", "_extra_fields"})
+
+
+# Immutable values that are safe to return as is instead of copied
+_ATOMIC_TYPES = frozenset(
+    {type(None), bool, int, float, str, bytes, datetime.date, datetime.datetime}
+)
+
+
+def _asdict_value(value: Any) -> Any:
+    # Same conversion as dataclasses.asdict but for a single field value.
+    # Atomic values skip the deepcopy machinery, which asdict only does
+    # since Python 3.12.
+    if type(value) in _ATOMIC_TYPES:
+        return value
+
+    if is_dataclass(value) and not isinstance(value, type):
+        dict_ = {k: _asdict_value(getattr(value, k)) for k in value.__dataclass_fields__}
+        # Models leave _extra_fields as None until used, still convert it to a dict
+        if "_extra_fields" in dict_ and dict_["_extra_fields"] is None:
+            dict_["_extra_fields"] = {}
+
+        return dict_
+
+    if isinstance(value, (list, tuple)):
+        return type(value)(_asdict_value(v) for v in value)
+
+    if isinstance(value, dict):
+        return {_asdict_value(k): _asdict_value(v) for k, v in value.items()}
+
+    return copy.deepcopy(value)
+
 
 @dataclass
 class SgIdMixin:
@@ -26,70 +68,121 @@ class SgIdMixin:
 
 @dataclass
 class SgBaseModel:
-    _extra_fields: dict = field(default_factory=dict)
-
-    @staticmethod
-    def _get_model(
-        field_name: str,
-        value: None | dict | list[dict],
-        model_lookup: dict[str, Type[SgBaseModel]],
-    ) -> None | dict | list[dict] | list[SgBaseModel] | SgBaseModel:
-        if value is None:
-            return None
+    # None until there is something to keep to spare every model an empty dict,
+    # use extra_fields to read or update it
+    _extra_fields: Optional[dict] = None
 
-        model = model_lookup[field_name]
-        if isinstance(value, list):
-            value_: list[dict] = value
-            return [model.from_dict(_v) for _v in value_]
-        else:
-            value_: dict = value
-            return model.from_dict(value_)
-
-    def to_dict(self, include_extra_fields=False) -> Dict[str, Any]:
-        dict_ = {
-            k: v for k, v in asdict(self).items() if v
-        }
-        dict_.pop("id", None)
-        dict_.pop("type", None)
-        extra_fields = dict_.pop("_extra_fields", {})
-        if include_extra_fields:
-            dict_.update(extra_fields)
+    # Field name to model class name for fields that hold nested SG entities.
+    # Names are resolved on first from_dict as most models are defined later.
+    _nested_models = {}
+
+    @property
+    def extra_fields(self) -> dict:
+        if self._extra_fields is None:
+            self._extra_fields = {}
+
+        return self._extra_fields
+
+    @classmethod
+    def _get_nested_models(cls) -> dict[str, Type[SgBaseModel]]:
+        nested_models = cls.__dict__.get("_resolved_nested_models")
+        if nested_models is None:
+            nested_models = {
+                field_name: globals()[model_name]
+                for field_name, model_name in cls._nested_models.items()
+            }
+            cls._resolved_nested_models = nested_models
+
+        return nested_models
+
+    @classmethod
+    def _get_to_dict_fields(cls) -> tuple[tuple[str, bool], ...]:
+        # (field name, whether the field has a truthy default)
+        to_dict_fields = cls.__dict__.get("_to_dict_fields")
+        if to_dict_fields is None:
+            to_dict_fields = tuple(
+                (k, f.default is not MISSING and bool(f.default))
+                for k, f in cls.__dataclass_fields__.items()
+                if k not in TO_DICT_SKIPPED_FIELDS
+            )
+            cls._to_dict_fields = to_dict_fields
+
+        return to_dict_fields
+
+    def to_dict(
+        self,
+        include_extra_fields=False,
+        exclude: AbstractSet[str] = frozenset(),
+    ) -> Dict[str, Any]:
+        # Only convert the fields that are kept instead of asdict deep copying
+        # the whole model, including every nested model, then dropping most of it
+        dict_ = {}
+        for k, truthy_default in self._get_to_dict_fields():
+            if exclude and k in exclude:
+                continue
+
+            # Empty values are left out unless they override a truthy default
+            # (e.g. vacation=False) as leaving those out would not unset them
+            v = getattr(self, k)
+            if v or truthy_default:
+                dict_[k] = _asdict_value(v)
+
+        if include_extra_fields and self._extra_fields:
+            dict_.update(_asdict_value(self._extra_fields))
 
         return dict_
 
     def to_full_dict(self, include_extra_fields=False) -> Dict[str, Any]:
-        dict_ = {
-            k: v for k, v in asdict(self).items() if v
-        }
-        extra_fields = dict_.pop("_extra_fields", {})
-        if include_extra_fields:
-            dict_.update(extra_fields)
+        dict_ = {}
+        for k in self.__dataclass_fields__:
+            if k == "_extra_fields":
+                continue
+
+            v = getattr(self, k)
+            if v:
+                dict_[k] = _asdict_value(v)
+
+        if include_extra_fields and self._extra_fields:
+            dict_.update(_asdict_value(self._extra_fields))
 
         return dict_
 
     @classmethod
     def from_dict(cls, dict_):
-        params = inspect.signature(cls).parameters
+        params = cls.__dataclass_fields__
+        nested_models = cls._get_nested_models()
 
-        sanitized_dict = {}
+        # Single pass over the row: known fields become init kwargs and the
+        # rest is kept as is (original key) in _extra_fields
+        kwargs = {}
+        _extra_fields = None
         for k, v in dict_.items():
-            if "." in k:
-                k = k.replace(".", "__")
-            sanitized_dict[k] = v
+            field_name = k.replace(".", "__") if "." in k else k
+            if field_name not in params:
+                # Rows usually hold only the requested fields so only
+                # allocate when there is something to keep
+                if _extra_fields is None:
+                    _extra_fields = {}
 
-        _extra_fields = {}
-        for k, v in dict_.items():
-            if k not in params:
                 _extra_fields[k] = v
+                continue
 
-        sanitized_dict["_extra_fields"] = _extra_fields
+            model = nested_models.get(field_name)
+            if model is not None:
+                # Single entity or multi-entity field
+                if type(v) is list:
+                    v = list(map(model.from_dict, v))
+                elif v is not None:
+                    v = model.from_dict(v)
+            elif field_name == "type":
+                v = ENTITY_TYPES.get(v, v)
 
-        return cls(
-            **{
-                k: v for k, v in sanitized_dict.items()
-                if k in params
-            }
-        )
+            kwargs[field_name] = v
+
+        if _extra_fields is not None:
+            kwargs["_extra_fields"] = _extra_fields
+
+        return cls(**kwargs)
 
 
 @dataclass
@@ -97,6 +190,20 @@ class SgGenericEntity(SgIdMixin, SgBaseModel):
     name: str = ""
     type: str = ""
 
+    @classmethod
+    def from_dict(cls, dict_):
+        # Entity links (the bulk of the nested values) only hold these keys so
+        # build them directly instead of going through the generic loop
+        if dict_.keys() <= _GENERIC_ENTITY_KEYS:
+            entity_type = dict_.get("type", "")
+            return cls(
+                id=dict_.get("id", 0),
+                name=dict_.get("name", ""),
+                type=ENTITY_TYPES.get(entity_type, entity_type),
+            )
+
+        return super().from_dict(dict_)
+
 
 @dataclass
 class SgNoteThreadGroup(SgBaseModel):
@@ -113,29 +220,10 @@ class SgNoteThreadGroup(SgBaseModel):
     def is_reply_type(self):
         return self.type == SgEntity.REPLY
 
-    @classmethod
-    def from_dict(cls, dict_):
-        params = inspect.signature(cls).parameters
-
-        _map = {
-            "attachments": SgGenericEntity,
-            "user": SgHumanUser,
-        }
-
-        sanitized_dict = {}
-        for k, v in dict_.items():
-            if "." in k:
-                k = k.replace(".", "__")
-
-            v = cls._get_model(k, v, _map) if k in _map else v
-            sanitized_dict[k] = v
-
-        return cls(
-            **{
-                k: v for k, v in sanitized_dict.items()
-                if k in params
-            }
-        )
+    _nested_models = {
+        "attachments": "SgGenericEntity",
+        "user": "SgHumanUser",
+    }
 
 
 @dataclass
@@ -200,29 +288,10 @@ class SgReply(SgIdMixin, SgBaseModel):
     publish_status: str = ""
     type: str = SgEntity.REPLY
 
-    @classmethod
-    def from_dict(cls, dict_):
-        params = inspect.signature(cls).parameters
-
-        _map = {
-            "user": SgHumanUser,
-            "entity": SgGenericEntity,
-        }
-
-        sanitized_dict = {}
-        for k, v in dict_.items():
-            if "." in k:
-                k = k.replace(".", "__")
-
-            v = cls._get_model(k, v, _map) if k in _map else v
-            sanitized_dict[k] = v
-
-        return cls(
-            **{
-                k: v for k, v in sanitized_dict.items()
-                if k in params
-            }
-        )
+    _nested_models = {
+        "user": "SgHumanUser",
+        "entity": "SgGenericEntity",
+    }
 
 
 @dataclass
@@ -239,34 +308,15 @@ class SgNote(SgIdMixin, SgBaseModel):
     sg_status_list: str = ""
     type: str = SgEntity.NOTE
 
-    @classmethod
-    def from_dict(cls, dict_):
-        params = inspect.signature(cls).parameters
-
-        _map = {
-            "project": SgProject,
-            "user": SgHumanUser,
-            "addressings_cc": SgGenericEntity,
-            "addressings_to": SgGenericEntity,
-            "note_links": SgGenericEntity,
-            "attachments": SgGenericEntity,
-            "replies": SgGenericEntity,
-        }
-
-        sanitized_dict = {}
-        for k, v in dict_.items():
-            if "." in k:
-                k = k.replace(".", "__")
-
-            v = cls._get_model(k, v, _map) if k in _map else v
-            sanitized_dict[k] = v
-
-        return cls(
-            **{
-                k: v for k, v in sanitized_dict.items()
-                if k in params
-            }
-        )
+    _nested_models = {
+        "project": "SgProject",
+        "user": "SgHumanUser",
+        "addressings_cc": "SgGenericEntity",
+        "addressings_to": "SgGenericEntity",
+        "note_links": "SgGenericEntity",
+        "attachments": "SgGenericEntity",
+        "replies": "SgGenericEntity",
+    }
 
 
 @dataclass
@@ -289,31 +339,15 @@ class SgProject(SgIdMixin, SgBaseModel):
     users: list[SgHumanUser] = field(default_factory=list)
     type: str = SgEntity.PROJECT
 
-    @classmethod
-    def from_dict(cls, dict_):
-        params = inspect.signature(cls).parameters
-
-        _map = {
-            "users": SgHumanUser,
-        }
-
-        sanitized_dict = {}
-        for k, v in dict_.items():
-            if "." in k:
-                k = k.replace(".", "__")
-
-            v = cls._get_model(k, v, _map) if k in _map else v
-            sanitized_dict[k] = v
+    _nested_models = {
+        "users": "SgHumanUser",
+    }
 
-        return cls(
-            **{
-                k: v for k, v in sanitized_dict.items()
-                if k in params
-            }
-        )
+    def validate_stale_data(self, current_dt: Optional[datetime.datetime] = None) -> bool:
+        # Pass current_dt when checking many projects to get the time only once
+        if current_dt is None:
+            current_dt = get_current_utc_dt()
 
-    def validate_stale_data(self) -> bool:
-        current_dt = get_current_utc_dt()
         return self.updated_at > current_dt
 
 
@@ -370,36 +404,17 @@ class _SgVersion(SgBaseModel):
     sg_version_type: str = ""
     type: str = SgEntity.VERSION
 
-    @classmethod
-    def from_dict(cls, dict_):
-        params = inspect.signature(cls).parameters
-
-        _map = {
-            "project": SgProject,
-            "entity": SgGenericEntity,
-            "user": SgHumanUser,
-            "cuts": SgGenericEntity,
-            "sg_task": SgGenericEntity,
-            "tasks": SgGenericEntity,
-            "playlists": SgGenericEntity,
-            "notes": SgGenericEntity,
-            "open_notes": SgGenericEntity,
-        }
-
-        sanitized_dict = {}
-        for k, v in dict_.items():
-            if "." in k:
-                k = k.replace(".", "__")
-
-            v = cls._get_model(k, v, _map) if k in _map else v
-            sanitized_dict[k] = v
-
-        return cls(
-            **{
-                k: v for k, v in sanitized_dict.items()
-                if k in params
-            }
-        )
+    _nested_models = {
+        "project": "SgProject",
+        "entity": "SgGenericEntity",
+        "user": "SgHumanUser",
+        "cuts": "SgGenericEntity",
+        "sg_task": "SgGenericEntity",
+        "tasks": "SgGenericEntity",
+        "playlists": "SgGenericEntity",
+        "notes": "SgGenericEntity",
+        "open_notes": "SgGenericEntity",
+    }
 
 
 @dataclass
@@ -437,36 +452,17 @@ class _SgShot(SgBaseModel):
     sg_versions: list[SgGenericEntity] = field(default_factory=list)
     type: str = SgEntity.SHOT
 
-    @classmethod
-    def from_dict(cls, dict_):
-        params = inspect.signature(cls).parameters
-
-        _map = {
-            "project": SgProject,
-            "notes": SgGenericEntity,
-            "open_notes": SgGenericEntity,
-            "assets": SgGenericEntity,
-            "tasks": SgGenericEntity,
-            "parent_shots": SgGenericEntity,
-            "shots": SgGenericEntity,
-            "sg_published_files": SgGenericEntity,
-            "sg_versions": SgGenericEntity,
-        }
-
-        sanitized_dict = {}
-        for k, v in dict_.items():
-            if "." in k:
-                k = k.replace(".", "__")
-
-            v = cls._get_model(k, v, _map) if k in _map else v
-            sanitized_dict[k] = v
-
-        return cls(
-            **{
-                k: v for k, v in sanitized_dict.items()
-                if k in params
-            }
-        )
+    _nested_models = {
+        "project": "SgProject",
+        "notes": "SgGenericEntity",
+        "open_notes": "SgGenericEntity",
+        "assets": "SgGenericEntity",
+        "tasks": "SgGenericEntity",
+        "parent_shots": "SgGenericEntity",
+        "shots": "SgGenericEntity",
+        "sg_published_files": "SgGenericEntity",
+        "sg_versions": "SgGenericEntity",
+    }
 
 
 @dataclass
@@ -503,35 +499,16 @@ class _SgTask(SgBaseModel):
     sg_status_list: str = ""
     type: str = SgEntity.TASK
 
-    @classmethod
-    def from_dict(cls, dict_):
-        params = inspect.signature(cls).parameters
-
-        _map = {
-            "task_reviewers": SgHumanUser,
-            "task_assignees": SgHumanUser,
-            "entity": SgGenericEntity,
-            "project": SgProject,
-            "sg_versions": SgGenericEntity,
-            "step": SgGenericEntity,
-            "notes": SgGenericEntity,
-            "open_notes": SgGenericEntity,
-        }
-
-        sanitized_dict = {}
-        for k, v in dict_.items():
-            if "." in k:
-                k = k.replace(".", "__")
-
-            v = cls._get_model(k, v, _map) if k in _map else v
-            sanitized_dict[k] = v
-
-        return cls(
-            **{
-                k: v for k, v in sanitized_dict.items()
-                if k in params
-            }
-        )
+    _nested_models = {
+        "task_reviewers": "SgHumanUser",
+        "task_assignees": "SgHumanUser",
+        "entity": "SgGenericEntity",
+        "project": "SgProject",
+        "sg_versions": "SgGenericEntity",
+        "step": "SgGenericEntity",
+        "notes": "SgGenericEntity",
+        "open_notes": "SgGenericEntity",
+    }
 
 
 @dataclass
@@ -555,33 +532,14 @@ class _SgAsset(SgBaseModel):
     sg_versions: list[SgGenericEntity] = field(default_factory=list)
     type: str = SgEntity.ASSET
 
-    @classmethod
-    def from_dict(cls, dict_):
-        params = inspect.signature(cls).parameters
-
-        _map = {
-            "tasks": SgTask,
-            "notes": SgGenericEntity,
-            "open_notes": SgGenericEntity,
-            "project": SgProject,
-            "sg_published_files": SgGenericEntity,
-            "sg_versions": SgGenericEntity,
-        }
-
-        sanitized_dict = {}
-        for k, v in dict_.items():
-            if "." in k:
-                k = k.replace(".", "__")
-
-            v = cls._get_model(k, v, _map) if k in _map else v
-            sanitized_dict[k] = v
-
-        return cls(
-            **{
-                k: v for k, v in sanitized_dict.items()
-                if k in params
-            }
-        )
+    _nested_models = {
+        "tasks": "SgTask",
+        "notes": "SgGenericEntity",
+        "open_notes": "SgGenericEntity",
+        "project": "SgProject",
+        "sg_published_files": "SgGenericEntity",
+        "sg_versions": "SgGenericEntity",
+    }
 
 
 @dataclass
@@ -604,32 +562,13 @@ class _SgPlaylist(SgBaseModel):
     versions: List[SgVersion] = field(default_factory=list)
     type: str = SgEntity.PLAYLIST
 
-    @classmethod
-    def from_dict(cls, dict_):
-        params = inspect.signature(cls).parameters
-
-        _map = {
-            "locked_by": SgHumanUser,
-            "project": SgProject,
-            "notes": SgGenericEntity,
-            "open_notes": SgGenericEntity,
-            "versions": SgVersion,
-        }
-
-        sanitized_dict = {}
-        for k, v in dict_.items():
-            if "." in k:
-                k = k.replace(".", "__")
-
-            v = cls._get_model(k, v, _map) if k in _map else v
-            sanitized_dict[k] = v
-
-        return cls(
-            **{
-                k: v for k, v in sanitized_dict.items()
-                if k in params
-            }
-        )
+    _nested_models = {
+        "locked_by": "SgHumanUser",
+        "project": "SgProject",
+        "notes": "SgGenericEntity",
+        "open_notes": "SgGenericEntity",
+        "versions": "SgVersion",
+    }
 
 
 @dataclass
@@ -656,41 +595,13 @@ class _SgHumanUser(SgBaseModel):
     sg_status_list: str = ""
     type: str = SgEntity.HUMANUSER
 
-    @classmethod
-    def from_dict(cls, dict_):
-        params = inspect.signature(cls).parameters
-
-        _map = {
-            "groups": SgGenericEntity,
-            "bookings": SgGenericEntity,
-            "department": SgGenericEntity,
-            "projects": SgProject,
-            "contracts": SgGenericEntity,
-        }
-
-        sanitized_dict = {}
-        for k, v in dict_.items():
-            if "." in k:
-                k = k.replace(".", "__")
-
-            v = cls._get_model(k, v, _map) if k in _map else v
-            sanitized_dict[k] = v
-
-        return cls(
-            **{
-                k: v for k, v in sanitized_dict.items()
-                if k in params
-            }
-        )
-
-    def to_dict(self) -> Dict[str, Any]:
-        dict_ = {
-            k: v for k, v in asdict(self).items() if v
-        }
-        dict_.pop("id", None)
-        dict_.pop("type", None)
-
-        return dict_
+    _nested_models = {
+        "groups": "SgGenericEntity",
+        "bookings": "SgGenericEntity",
+        "department": "SgGenericEntity",
+        "projects": "SgProject",
+        "contracts": "SgGenericEntity",
+    }
 
 
 @dataclass
@@ -710,29 +621,10 @@ class _SgBooking(SgBaseModel):
     sg_status_list: str = ""
     type: str = SgEntity.BOOKING
 
-    @classmethod
-    def from_dict(cls, dict_):
-        params = inspect.signature(cls).parameters
-
-        _map = {
-            "user": SgHumanUser,
-            "project": SgProject,
-        }
-
-        sanitized_dict = {}
-        for k, v in dict_.items():
-            if "." in k:
-                k = k.replace(".", "__")
-
-            v = cls._get_model(k, v, _map) if k in _map else v
-            sanitized_dict[k] = v
-
-        return cls(
-            **{
-                k: v for k, v in sanitized_dict.items()
-                if k in params
-            }
-        )
+    _nested_models = {
+        "user": "SgHumanUser",
+        "project": "SgProject",
+    }
 
     def __post_init__(self):
         valid_start_date = validate_sg_date_format(self.start_date)
@@ -757,30 +649,11 @@ class _SgTimeLog(SgBaseModel):
     user: Optional[SgHumanUser] = None
     type: str = SgEntity.TIMELOG
 
-    @classmethod
-    def from_dict(cls, dict_):
-        params = inspect.signature(cls).parameters
-
-        _map = {
-            "entity": SgGenericEntity,
-            "project": SgProject,
-            "user": SgHumanUser,
-        }
-
-        sanitized_dict = {}
-        for k, v in dict_.items():
-            if "." in k:
-                k = k.replace(".", "__")
-
-            v = cls._get_model(k, v, _map) if k in _map else v
-            sanitized_dict[k] = v
-
-        return cls(
-            **{
-                k: v for k, v in sanitized_dict.items()
-                if k in params
-            }
-        )
+    _nested_models = {
+        "entity": "SgGenericEntity",
+        "project": "SgProject",
+        "user": "SgHumanUser",
+    }
 
     def __post_init__(self):
         valid_date = validate_sg_date_format(self.date)
@@ -789,7 +662,8 @@ class _SgTimeLog(SgBaseModel):
             raise InvalidSgDateFormatException("Date format must be YYYY-MM-DD")
 
     def get_date(self) -> datetime.date:
-        timelog_date = datetime.datetime.strptime(self.date, SG_DATE_FORMAT).date()
+        # SG date is ISO 8601 (YYYY-MM-DD) so skip the slower strptime
+        timelog_date = datetime.date.fromisoformat(self.date)
         return timelog_date
 
 
@@ -825,26 +699,24 @@ class SgAttachment(SgBaseModel):
     open_notes_count: int = 0
     sg_status_list: str = ""
 
-    @classmethod
-    def from_dict(cls, dict_):
-        params = inspect.signature(cls).parameters
+    _nested_models = {
+        "this_file": "SgAttachmentFile",
+        "created_by": "SgHumanUser",
+    }
 
-        _map = {
-            "this_file": SgAttachmentFile,
-            "created_by": SgHumanUser,
-        }
 
-        sanitized_dict = {}
-        for k, v in dict_.items():
-            if "." in k:
-                k = k.replace(".", "__")
+@dataclass
+class BulkResult:
+    """The outcome of a bulk (sg.batch) operation
 
-            v = cls._get_model(k, v, _map) if k in _map else v
-            sanitized_dict[k] = v
+    Truthy when the batch succeeded so existing `if kon.bulk_...(...)` checks
+    keep working, while `failed_ids` and `response` spare callers from
+    re-querying SG to find out what happened.
 
-        return cls(
-            **{
-                k: v for k, v in sanitized_dict.items()
-                if k in params
-            }
-        )
+    """
+    ok: bool = True
+    failed_ids: list[int] = field(default_factory=list)
+    response: list = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return self.ok
@@ -1,13 +1,17 @@
 import datetime
+import functools
 import re
 from typing import Optional
 
 SG_DATE_FORMAT = "%Y-%m-%d"  # E.g: 2022-02-22
 SG_DT_FORMAT = "%Y-%m-%dT%H:%M:%SZ"  # 2023-08-07T06:29:35Z where Z indicates UTC
 UTC = datetime.timezone.utc
-LOCAL_TZ = datetime.datetime.utcnow().astimezone().tzinfo
+LOCAL_TZ = datetime.datetime.now(UTC).astimezone().tzinfo  # Offset at import time
+SG_DATE_PATTERN = re.compile(r"^\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])$")
 
 
+# Booking and TimeLog dates repeat a lot across one query so cache the result
+@functools.lru_cache(maxsize=1024)
 def validate_sg_date_format(date: str) -> bool:
     """Validate SG Date Format
 
@@ -24,11 +28,7 @@ def validate_sg_date_format(date: str) -> bool:
         True if valid SG Date format
 
     """
-    result = re.match(
-        r"^\d{4}-(0[1-9]|1[012])-(0[1-9]|[12][0-9]|3[01])$",
-        date,
-    )
-    return bool(result)
+    return SG_DATE_PATTERN.match(date) is not None
 
 
 def try_strptime(dt_str: str, use_local_tz=False) -> Optional[datetime.datetime]:
@@ -52,26 +52,39 @@ def try_strptime(dt_str: str, use_local_tz=False) -> Optional[datetime.datetime]
     if not dt_str:
         return None
 
-    # TODO: Simplify this logic as there should only one... string format unless
-    #  Autodesk decided to return a completely new datetime string format
-    dt_fmts = [
-        SG_DT_FORMAT,
-    ]
-
-    for dt_fmt in dt_fmts:
+    dt = _parse_sg_dt(dt_str)
+    if dt is None or not use_local_tz:
+        return dt
+
+    # Convert with the system timezone instead of LOCAL_TZ so the offset (e.g.
+    # DST) is the one in effect at dt rather than when konbinine was imported
+    return dt.astimezone()
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_sg_dt(dt_str: str) -> Optional[datetime.datetime]:
+    # Cached as the same timestamps repeat across rows. datetime is immutable
+    # so the cached value is safe to share.
+    # SG returns 2023-08-07T06:29:35Z so parse that shape with the C-level
+    # fromisoformat and only fall back to the slower strptime for the rest
+    if (
+        len(dt_str) == 20
+        and dt_str[-1] == "Z"
+        and dt_str[4] == dt_str[7] == "-"
+        and dt_str[10] == "T"
+        and dt_str[13] == dt_str[16] == ":"
+    ):
         try:
-            dt = datetime.datetime.strptime(dt_str, dt_fmt)
-            dt = dt.replace(tzinfo=UTC)
-            if not use_local_tz:
-                return dt
-
-            dt = dt.astimezone(LOCAL_TZ)
-            return dt
-
+            return datetime.datetime.fromisoformat(dt_str[:-1]).replace(tzinfo=UTC)
         except ValueError:
-            continue
+            pass
+
+    try:
+        dt = datetime.datetime.strptime(dt_str, SG_DT_FORMAT)
+    except ValueError:
+        return None
 
-    return None
+    return dt.replace(tzinfo=UTC)
 
 
 def get_current_utc_dt() -> datetime.datetime: